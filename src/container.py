@@ -1,39 +1,67 @@
 """Dependency injection container setup."""
 
-from lagom import Container
+from lagom import Container, Singleton
 
 from src.modules.account.config.event_config import create_configured_event_dispatcher
+from src.modules.account.repository.coalescing_user_repository import (
+    CoalescingUserRepository,
+)
+from src.modules.account.repository.user_repository import AbstractUserRepository
 from src.modules.account.repository.user_repository_mongo import (
     MongoUserRepository,
 )
 from src.modules.account.use_case.create_user_use_case import CreateUserUseCase
 from src.modules.account.use_case.delete_user_use_case import DeleteUserUseCase
-from src.modules.account.use_case.get_user_use_case import GetUserUseCase
+from src.modules.account.use_case.get_user_use_case import GetUserUseCase, UserCache
 from src.modules.account.use_case.update_user_use_case import UpdateUserUseCase
-from src.modules.core.domain.event_dispatcher import EventDispatcher
+from src.modules.core.domain.event_dispatcher import (
+    AsyncQueueEventDispatcher,
+    EventDispatcher,
+)
 from src.settings import CONFIG, Settings
 
 container = Container()
 
 container[Settings] = CONFIG
 
-# Register repository implementation
-container[MongoUserRepository] = MongoUserRepository()
+# Bind the repository port to its implementation, built on first resolution.
+# Use cases depend on the port only, so this is the one place to swap backends.
+# Concurrent reads of the same user are coalesced into a single query.
+container[AbstractUserRepository] = Singleton(  # type: ignore[type-abstract]
+    lambda: CoalescingUserRepository(MongoUserRepository())
+)
 
-# Register pre-configured event dispatcher
-container[EventDispatcher] = create_configured_event_dispatcher()
+# Register pre-configured event dispatcher. Use cases only see the base
+# type; the app lifecycle starts and stops its background worker.
+event_dispatcher = create_configured_event_dispatcher(AsyncQueueEventDispatcher())
+container[AsyncQueueEventDispatcher] = event_dispatcher
+container[EventDispatcher] = event_dispatcher
 
-# Register use cases
-container[CreateUserUseCase] = lambda c: CreateUserUseCase(
-    user_repository=c[MongoUserRepository], event_dispatcher=c[EventDispatcher]
+# Shared read cache: GetUserUseCase fills it, commands invalidate it
+container[UserCache] = UserCache(maxsize=10_000, ttl=1.0)
+
+# Register use cases as singletons: they are stateless, so build each once
+container[CreateUserUseCase] = Singleton(
+    lambda c: CreateUserUseCase(
+        user_repository=c[AbstractUserRepository], event_dispatcher=c[EventDispatcher]
+    )
 )
-container[GetUserUseCase] = lambda c: GetUserUseCase(
-    user_repository=c[MongoUserRepository],
+container[GetUserUseCase] = Singleton(
+    lambda c: GetUserUseCase(
+        user_repository=c[AbstractUserRepository], user_cache=c[UserCache]
+    )
 )
-container[UpdateUserUseCase] = lambda c: UpdateUserUseCase(
-    user_repository=c[MongoUserRepository], event_dispatcher=c[EventDispatcher]
+container[UpdateUserUseCase] = Singleton(
+    lambda c: UpdateUserUseCase(
+        user_repository=c[AbstractUserRepository],
+        event_dispatcher=c[EventDispatcher],
+        user_cache=c[UserCache],
+    )
 )
-
-container[DeleteUserUseCase] = lambda c: DeleteUserUseCase(
-    user_repository=c[MongoUserRepository], event_dispatcher=c[EventDispatcher]
+container[DeleteUserUseCase] = Singleton(
+    lambda c: DeleteUserUseCase(
+        user_repository=c[AbstractUserRepository],
+        event_dispatcher=c[EventDispatcher],
+        user_cache=c[UserCache],
+    )
 )
@@ -4,13 +4,36 @@ This module provides a more advanced approach to event handler
 registration using a configuration class pattern.
 """
 
+from collections.abc import Mapping
+
 from src.modules.account.domain.events import UserCreated, UserEmailChanged
 from src.modules.account.handlers.user_handlers import (
     UserAnalyticsHandler,
     UserAuditHandler,
     UserNotificationHandler,
 )
-from src.modules.core.domain.event_dispatcher import EventDispatcher
+from src.modules.core.domain.domain_event import DomainEvent
+from src.modules.core.domain.event_dispatcher import EventCallback, EventDispatcher
+
+# Stateless handlers shared by every user event type
+_NOTIFICATION_HANDLER = UserNotificationHandler()
+_AUDIT_HANDLER = UserAuditHandler()
+_ANALYTICS_HANDLER = UserAnalyticsHandler()
+
+# Each event type maps straight to the callbacks that handle it, in
+# dispatch order, so handlers never see events they do not care about
+_USER_EVENT_SUBSCRIPTIONS: Mapping[type[DomainEvent], tuple[EventCallback, ...]] = {
+    UserCreated: (
+        _NOTIFICATION_HANDLER.on_user_created,
+        _AUDIT_HANDLER.on_user_created,
+        _ANALYTICS_HANDLER.on_user_created,
+    ),
+    UserEmailChanged: (
+        _NOTIFICATION_HANDLER.on_user_email_changed,
+        _AUDIT_HANDLER.on_user_email_changed,
+        _ANALYTICS_HANDLER.on_user_email_changed,
+    ),
+}
 
 
 class EventConfiguration:
@@ -41,31 +64,21 @@ class EventConfiguration:
         Args:
             dispatcher: The event dispatcher to configure.
         """
-        # Create handler instances
-        notification_handler = UserNotificationHandler()
-        audit_handler = UserAuditHandler()
-        analytics_handler = UserAnalyticsHandler()
-
-        # UserCreated event subscriptions
-        dispatcher.subscribe(UserCreated, notification_handler)
-        dispatcher.subscribe(UserCreated, audit_handler)
-        dispatcher.subscribe(UserCreated, analytics_handler)
+        dispatcher.bulk_subscribe(_USER_EVENT_SUBSCRIPTIONS)
 
-        # UserEmailChanged event subscriptions
-        dispatcher.subscribe(UserEmailChanged, notification_handler)
-        dispatcher.subscribe(UserEmailChanged, audit_handler)
-        dispatcher.subscribe(UserEmailChanged, analytics_handler)
 
+def create_configured_event_dispatcher[D: EventDispatcher](dispatcher: D) -> D:
+    """Configure and freeze an event dispatcher.
 
-def create_configured_event_dispatcher() -> EventDispatcher:
-    """Create and configure an event dispatcher.
+    Factory function that subscribes all necessary handlers to the given
+    EventDispatcher instance, whichever delivery strategy it implements.
 
-    Factory function that creates an EventDispatcher instance
-    and configures it with all necessary handlers.
+    Args:
+        dispatcher: The dispatcher to configure.
 
     Returns:
-        A fully configured EventDispatcher instance.
+        The same dispatcher, fully configured and frozen.
     """
-    dispatcher = EventDispatcher()
     EventConfiguration.configure_dispatcher(dispatcher)
+    dispatcher.freeze()
     return dispatcher
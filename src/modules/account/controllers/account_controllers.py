@@ -1,15 +1,17 @@
 """Account Controllers Module."""
 
 from dataclasses import dataclass
-from typing import Annotated, final
+from typing import Annotated, Any, NoReturn, final
 
-from litestar import Controller, delete, get, post, put
+from litestar import Controller, Request, Response, delete, get, post, put
 from litestar.di import Provide
 from litestar.dto import DataclassDTO
 from litestar.exceptions import NotFoundException
 from litestar.params import Body
 
 from src.container import container
+from src.modules.account.domain.user import User
+from src.modules.account.repository.user_repository import EmailAlreadyInUse
 from src.modules.account.use_case.create_user_use_case import (
     CreateUserCommand,
     CreateUserUseCase,
@@ -77,6 +79,52 @@ class UserUpdate:
 UserUpdateDTO = DataclassDTO[UserUpdate]
 
 
+def _to_read(domain_user: User) -> UserRead:
+    """Map a domain user to its API representation.
+
+    Args:
+        domain_user: The user entity to convert.
+
+    Returns:
+        UserRead: The user data returned by the API.
+    """
+    return UserRead(
+        user_id=domain_user.id_str,
+        name=domain_user.name.value,
+        age=domain_user.age.value,
+        email=domain_user.email.value,
+    )
+
+
+def _raise_not_found(user_id: str) -> NoReturn:
+    """Raise the 404 error for a missing user.
+
+    Kept out of the handlers so the found-user path stays branch-free.
+
+    Args:
+        user_id: The ID that did not match any user.
+
+    Raises:
+        NotFoundException: Always.
+    """
+    raise NotFoundException(f"User with ID '{user_id}' not found")
+
+
+def _email_conflict(
+    _: Request[Any, Any, Any], error: EmailAlreadyInUse
+) -> Response[dict[str, Any]]:
+    """Turn a unique email violation into a 409 Conflict response.
+
+    Args:
+        _: The request that failed.
+        error: The repository error carrying the conflicting email.
+
+    Returns:
+        Response: The error payload, shaped like Litestar's own errors.
+    """
+    return Response({"status_code": 409, "detail": str(error)}, status_code=409)
+
+
 @final
 class UserController(Controller):
     """Controller for user-related operations.
@@ -97,10 +145,11 @@ class UserController(Controller):
 
     path = "/users"
     tags = ["Users"]
+    dto = UserWriteDTO
+    return_dto = UserReadDTO
+    exception_handlers = {EmailAlreadyInUse: _email_conflict}
 
     @post(
-        dto=UserWriteDTO,
-        return_dto=UserReadDTO,
         status_code=201,
         summary="Create New User",
         description="""
@@ -120,7 +169,9 @@ class UserController(Controller):
         operation_id="create_user",
         dependencies={
             "create_user_use_case": Provide(
-                lambda: container[CreateUserUseCase], sync_to_thread=False
+                lambda: container[CreateUserUseCase],
+                sync_to_thread=False,
+                use_cache=True,
             ),
         },
     )
@@ -148,19 +199,12 @@ class UserController(Controller):
         Returns:
             UserRead: Complete user information including the generated unique ID
         """
-        command = CreateUserCommand(name=data.name, age=data.age, email=data.email)
+        command = CreateUserCommand(data.name, data.age, data.email)
         domain_user = await create_user_use_case.execute(command)
-        return UserRead(
-            name=domain_user.name.value,
-            age=domain_user.age.value,
-            email=domain_user.email.value,
-            user_id=str(domain_user.id),
-        )
+        return _to_read(domain_user)
 
     @get(
         "/{user_id:str}",
-        dto=UserUpdateDTO,
-        return_dto=UserReadDTO,
         summary="Get User by ID",
         description="""
         Retrieves a user by their unique identifier.
@@ -175,7 +219,7 @@ class UserController(Controller):
         operation_id="get_user",
         dependencies={
             "get_user_use_case": Provide(
-                lambda: container[GetUserUseCase], sync_to_thread=False
+                lambda: container[GetUserUseCase], sync_to_thread=False, use_cache=True
             ),
         },
     )
@@ -197,17 +241,14 @@ class UserController(Controller):
             UserRead: Complete user information for the requested user
         """
         query = GetUserQuery(user_id=user_id)
-        domain_user = await get_user_use_case.execute(query)
-
-        return UserRead(
-            name=domain_user.name.value,
-            age=domain_user.age.value,
-            email=domain_user.email.value,
-            user_id=str(domain_user.id),
+        domain_user = await get_user_use_case.execute(query) or _raise_not_found(
+            user_id
         )
+        return _to_read(domain_user)
 
     @put(
         "/{user_id:str}",
+        dto=UserUpdateDTO,
         summary="Update User by ID",
         description="""
         Updates user information for the specified user ID.
@@ -228,7 +269,9 @@ class UserController(Controller):
         operation_id="update_user",
         dependencies={
             "update_user_use_case": Provide(
-                lambda: container[UpdateUserUseCase], sync_to_thread=False
+                lambda: container[UpdateUserUseCase],
+                sync_to_thread=False,
+                use_cache=True,
             ),
         },
     )
@@ -249,19 +292,13 @@ class UserController(Controller):
             UserRead: Complete updated user information
 
         """
-        command = UpdateUserCommand(
-            user_id=user_id, name=data.name, age=data.age, email=data.email
-        )
+        command = UpdateUserCommand(user_id, data.name, data.age, data.email)
         updated_user = await update_user_use_case.execute(command)
-        return UserRead(
-            name=updated_user.name.value,
-            age=updated_user.age.value,
-            email=updated_user.email.value,
-            user_id=str(updated_user.id),
-        )
+        return _to_read(updated_user)
 
     @delete(
         "/{user_id:str}",
+        status_code=204,
         summary="Delete User by ID",
         description="""
         Deletes a user by their unique identifier.
@@ -276,7 +313,9 @@ class UserController(Controller):
         operation_id="delete_user",
         dependencies={
             "delete_user_use_case": Provide(
-                lambda: container[DeleteUserUseCase], sync_to_thread=False
+                lambda: container[DeleteUserUseCase],
+                sync_to_thread=False,
+                use_cache=True,
             ),
         },
     )
@@ -291,10 +330,6 @@ class UserController(Controller):
         Args:
             user_id: The unique identifier of the user to delete
             delete_user_use_case: Injected use case for user deletion business logic
-
-        Returns:
-            None
         """
-        command = DeleteUserCommand(user_id=user_id)
+        command = DeleteUserCommand(user_id)
         await delete_user_use_case.execute(command)
-        return None
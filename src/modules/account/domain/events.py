@@ -12,7 +12,7 @@ from bson import ObjectId
 from src.modules.core.domain.domain_event import DomainEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserCreated(DomainEvent):
     """Event raised when a new user is created.
 
@@ -31,29 +31,35 @@ class UserCreated(DomainEvent):
 
     @classmethod
     def create(
-        cls, aggregate_id: ObjectId, name: str, email: str, age: int
+        cls,
+        aggregate_id: ObjectId,
+        name: str,
+        email: str,
+        age: int,
+        occurred_at: datetime | None = None,
     ) -> "UserCreated":
-        """Create a UserCreated event with current timestamp.
+        """Create a UserCreated event, timestamped now unless given.
 
         Args:
             aggregate_id: The unique identifier of the user aggregate.
             name: The user's name.
             email: The user's email address.
             age: The user's age.
+            occurred_at: When the event occurred. Defaults to now.
 
         Returns:
             UserCreated: The created domain event instance.
         """
         return cls(
             aggregate_id=aggregate_id,
-            occurred_at=datetime.now(),
+            occurred_at=occurred_at if occurred_at is not None else datetime.now(),
             name=name,
             email=email,
             age=age,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserEmailChanged(DomainEvent):
     """Event raised when a user's email address is changed.
 
@@ -70,21 +76,26 @@ class UserEmailChanged(DomainEvent):
 
     @classmethod
     def create(
-        cls, aggregate_id: ObjectId, old_email: str, new_email: str
+        cls,
+        aggregate_id: ObjectId,
+        old_email: str,
+        new_email: str,
+        occurred_at: datetime | None = None,
     ) -> "UserEmailChanged":
-        """Create a UserEmailChanged event with current timestamp.
+        """Create a UserEmailChanged event, timestamped now unless given.
 
         Args:
             aggregate_id: The unique identifier of the user aggregate.
             old_email: The previous email address.
             new_email: The new email address.
+            occurred_at: When the event occurred. Defaults to now.
 
         Returns:
             UserEmailChanged: The created domain event instance.
         """
         return cls(
             aggregate_id=aggregate_id,
-            occurred_at=datetime.now(),
+            occurred_at=occurred_at if occurred_at is not None else datetime.now(),
             old_email=old_email,
             new_email=new_email,
         )
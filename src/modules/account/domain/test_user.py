@@ -4,7 +4,11 @@ from uuid import UUID
 
 import pytest
 
+from src.modules.account.domain.events import UserEmailChanged
 from src.modules.account.domain.user import User
+from src.modules.account.domain.value_objects.age import Age
+from src.modules.account.domain.value_objects.email import Email
+from src.modules.account.domain.value_objects.name import Name
 
 
 class TestUser:
@@ -104,3 +108,58 @@ class TestUser:
         assert "name='John Doe'" in repr_str
         assert "age=25" in repr_str
         assert "email='john@example.com'" in repr_str
+
+    def test_to_properties_round_trips_through_restore(self):
+        """Test that to_properties exports the values restore accepts."""
+        user = User.create({"name": "John Doe", "age": 25, "email": "john@example.com"})
+
+        properties = user.to_properties()
+        restored = User.restore(user_id=user.id, properties=properties)
+
+        assert properties == {
+            "name": "John Doe",
+            "age": 25,
+            "email": "john@example.com",
+        }
+        assert restored.to_properties() == properties
+        assert restored == user
+
+    def test_change_email_rejects_invalid_email_without_side_effects(self):
+        """Test that an invalid email leaves the user and its events untouched."""
+        user = User.create({"name": "John Doe", "age": 25, "email": "john@example.com"})
+        _ = user.pull_domain_events()
+
+        with pytest.raises(ValueError):
+            user.change_email("not-an-email")
+
+        assert user.email.value == "john@example.com"
+        assert user.domain_events == []
+
+    def test_apply_patch_changes_only_the_given_fields(self):
+        """Test that apply_patch replaces given fields and raises email events."""
+        user = User.create({"name": "John Doe", "age": 25, "email": "john@example.com"})
+        _ = user.pull_domain_events()
+        original_name = user.name
+
+        changed = user.apply_patch(age=Age(30), email=Email("new@example.com"))
+
+        assert changed is True
+        assert user.name is original_name
+        assert user.age.value == 30
+        assert user.email.value == "new@example.com"
+        events = user.pull_domain_events()
+        assert len(events) == 1
+        assert isinstance(events[0], UserEmailChanged)
+        assert events[0].old_email == "john@example.com"
+
+    def test_apply_patch_with_current_values_is_a_no_op(self):
+        """Test that repeating the current values reports no change."""
+        user = User.create({"name": "John Doe", "age": 25, "email": "john@example.com"})
+        _ = user.pull_domain_events()
+
+        assert user.apply_patch() is False
+        assert (
+            user.apply_patch(name=Name("John Doe"), email=Email("john@example.com"))
+            is False
+        )
+        assert user.domain_events == []
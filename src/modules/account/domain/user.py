@@ -5,6 +5,7 @@ logic for user-related operations such as age validation.
 """
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import TypedDict
 
 from bson import ObjectId
@@ -24,7 +25,15 @@ class UserProperties(TypedDict):
     email: str
 
 
-@dataclass(unsafe_hash=True)
+class UserPatch(TypedDict, total=False):
+    """Subset of User properties to change, keyed like UserProperties."""
+
+    name: str
+    age: int
+    email: str
+
+
+@dataclass(eq=False, slots=True)
 class User(Entity):
     """Represents a user in the system.
 
@@ -42,14 +51,17 @@ class User(Entity):
     email: Email
 
     @classmethod
-    def create(cls, properties: UserProperties) -> "User":
+    def create(
+        cls, properties: UserProperties, occurred_at: datetime | None = None
+    ) -> "User":
         """Create a new User instance with auto-generated ID.
 
         Args:
             properties: User properties containing name, age, and email.
+            occurred_at: Timestamp for the UserCreated event. Defaults to now.
 
         Returns:
-            A new User instance with auto-generated UUID.
+            A new User instance with auto-generated ObjectId.
         """
         user = cls(
             name=Name(properties["name"]),
@@ -63,6 +75,7 @@ class User(Entity):
                 name=properties["name"],
                 email=properties["email"],
                 age=properties["age"],
+                occurred_at=occurred_at,
             )
         )
 
@@ -87,6 +100,22 @@ class User(Entity):
         user.id = user_id
         return user
 
+    def to_properties(self) -> UserProperties:
+        """Export the user's primitive properties.
+
+        Inverse of restore, reading each value object directly so that
+        persistence adapters can map a user without going through
+        dataclasses.asdict.
+
+        Returns:
+            The user's name, age, and email as plain values.
+        """
+        return {
+            "name": self.name.value,
+            "age": self.age.value,
+            "email": self.email.value,
+        }
+
     def is_adult(self) -> bool:
         """Check if the user is an adult.
 
@@ -97,20 +126,70 @@ class User(Entity):
         """
         return self.age.is_adult()
 
-    def change_email(self, new_email: str) -> None:
+    def change_email(self, new_email: str, occurred_at: datetime | None = None) -> None:
         """Change the user's email.
 
         Command that modifies the current instance's email.
 
         Args:
             new_email: The new email for the user.
+            occurred_at: Timestamp for the UserEmailChanged event. Defaults
+                to now.
+        """
+        # Validate before touching self so a bad email leaves no torn state
+        self._replace_email(Email(new_email), occurred_at)
+
+    def apply_patch(
+        self,
+        *,
+        name: Name | None = None,
+        age: Age | None = None,
+        email: Email | None = None,
+        occurred_at: datetime | None = None,
+    ) -> bool:
+        """Apply a partial update in place.
+
+        Takes already validated value objects, so no field is validated
+        twice. Only fields that are given and differ from the current value
+        are replaced. A UserEmailChanged event is raised only when the email
+        actually changes.
+
+        Args:
+            name: The new name, or None to keep the current one.
+            age: The new age, or None to keep the current one.
+            email: The new email, or None to keep the current one.
+            occurred_at: Timestamp for any raised event. Defaults to now.
+
+        Returns:
+            True if any field changed, False otherwise.
+        """
+        changed = False
+        if name is not None and name != self.name:
+            self.name = name
+            changed = True
+        if age is not None and age != self.age:
+            self.age = age
+            changed = True
+        if email is not None and email != self.email:
+            self._replace_email(email, occurred_at)
+            changed = True
+        return changed
+
+    def _replace_email(self, new_email: Email, occurred_at: datetime | None) -> None:
+        """Assign an already validated email and record the change.
+
+        Args:
+            new_email: The new email value object.
+            occurred_at: Timestamp for the UserEmailChanged event.
         """
-        old_email = self.email.value
-        new_email_vo = Email(new_email)
-        self.email = new_email_vo
+        old_email = self.email
+        self.email = new_email
 
         self.add_domain_event(
             UserEmailChanged.create(
-                aggregate_id=self.id, old_email=old_email, new_email=new_email
+                aggregate_id=self.id,
+                old_email=old_email.value,
+                new_email=new_email.value,
+                occurred_at=occurred_at,
             )
         )
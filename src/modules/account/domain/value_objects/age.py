@@ -4,11 +4,11 @@ This module defines the Age value object with validation logic
 for user ages in the domain.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import override
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Age:
     """Represents a valid user age.
 
@@ -20,6 +20,7 @@ class Age:
     """
 
     value: int
+    _is_adult: bool = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate age after initialization.
@@ -33,13 +34,16 @@ class Age:
         if self.value > 150:
             raise ValueError("Age cannot exceed 150 years")
 
+        # Invariant for a frozen value object, so compute it once here
+        object.__setattr__(self, "_is_adult", self.value >= 18)
+
     def is_adult(self) -> bool:
         """Check if the age represents an adult.
 
         Returns:
             True if age is 18 or older, False otherwise.
         """
-        return self.value >= 18
+        return self._is_adult
 
     @override
     def __str__(self) -> str:
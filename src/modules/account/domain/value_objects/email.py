@@ -5,11 +5,14 @@ for user email addresses in the domain.
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import override
 
+# Compiled once at import; \Z (unlike $) also rejects a trailing newline
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Email:
     """Represents a valid email address.
 
@@ -21,6 +24,8 @@ class Email:
     """
 
     value: str
+    _local_part: str = field(init=False, repr=False, compare=False)
+    _domain: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate email after initialization.
@@ -31,30 +36,35 @@ class Email:
         if not self.value:
             raise ValueError("Email cannot be empty")
 
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, self.value):
-            raise ValueError("Invalid email format")
-
+        # Cheap length check first, so oversized input never reaches the regex
         if len(self.value) > 254:
             raise ValueError("Email cannot exceed 254 characters")
 
+        if _EMAIL_PATTERN.match(self.value) is None:
+            raise ValueError("Invalid email format")
+
+        # A valid address has exactly one "@", so split it once up front
+        local_part, _, domain = self.value.partition("@")
+        object.__setattr__(self, "_local_part", local_part)
+        object.__setattr__(self, "_domain", domain)
+
     @property
     def domain(self) -> str:
-        """Get the domain part of the email.
+        """The domain part of the email.
 
         Returns:
             The domain part of the email address.
         """
-        return self.value.split("@")[1]
+        return self._domain
 
     @property
     def local_part(self) -> str:
-        """Get the local part of the email.
+        """The local part of the email.
 
         Returns:
             The local part of the email address (before @).
         """
-        return self.value.split("@")[0]
+        return self._local_part
 
     @override
     def __str__(self) -> str:
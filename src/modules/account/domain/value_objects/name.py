@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import override
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Name:
     """Represents a valid user name.
 
@@ -27,10 +27,11 @@ class Name:
         Raises:
             ValueError: If the name is empty, has fewer than 2 characters, or exceeds 100 characters.
         """
-        if not self.value or self.value.strip() == "":
+        stripped = self.value.strip()
+        if not stripped:
             raise ValueError("Name cannot be empty")
 
-        if len(self.value.strip()) < 2:
+        if len(stripped) < 2:
             raise ValueError("Name must have at least 2 characters")
 
         if len(self.value) > 100:
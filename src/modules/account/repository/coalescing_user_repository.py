@@ -0,0 +1,119 @@
+"""Request-coalescing decorator for user repositories."""
+
+import asyncio
+from typing import override
+
+from src.modules.account.domain.user import User, UserPatch
+from src.modules.account.repository.user_repository import AbstractUserRepository
+
+
+class CoalescingUserRepository(AbstractUserRepository):
+    """Repository decorator that collapses concurrent reads of the same user.
+
+    While a get_user_by_id for an ID is in flight, further calls for that ID
+    await the same lookup instead of issuing their own, so a burst of N
+    concurrent reads costs a single round trip. Callers then share the
+    returned User and must treat it as read-only.
+
+    Writes go straight to the wrapped repository and drop any in-flight
+    read of the same user both before and after they run, so no read
+    started after a write returns can observe the state from before it,
+    even if the read it would join overlapped the write.
+    """
+
+    def __init__(self, inner: AbstractUserRepository) -> None:
+        """Wrap a repository.
+
+        Args:
+            inner: The repository that performs the actual operations.
+        """
+        self._inner = inner
+        self._in_flight: dict[str, asyncio.Task[User | None]] = {}
+
+    @override
+    async def get_user_by_id(self, user_id: str) -> User | None:
+        """Get a user by their ID, joining an identical read in flight.
+
+        Args:
+            user_id: The ID of the user to retrieve.
+
+        Returns:
+            The User object if found, otherwise None.
+        """
+        lookup = self._in_flight.get(user_id)
+        if lookup is None:
+            lookup = asyncio.create_task(self._inner.get_user_by_id(user_id))
+            self._in_flight[user_id] = lookup
+            lookup.add_done_callback(lambda done: self._forget(user_id, done))
+        # Shielded so one caller being cancelled does not fail the others
+        return await asyncio.shield(lookup)
+
+    @override
+    async def create_user(self, user_data: User) -> User:
+        """Create a new user.
+
+        Args:
+            user_data: The User object to create.
+
+        Returns:
+            The created User object.
+        """
+        return await self._inner.create_user(user_data)
+
+    @override
+    async def update_user(self, user_id: str, user_data: User) -> User | None:
+        """Update an existing user.
+
+        Args:
+            user_id: The ID of the user to update.
+            user_data: The User object with updated data.
+
+        Returns:
+            The updated User object if successful, otherwise None.
+        """
+        _ = self._in_flight.pop(user_id, None)
+        try:
+            return await self._inner.update_user(user_id, user_data)
+        finally:
+            # A read started while the write ran may still see the old state
+            _ = self._in_flight.pop(user_id, None)
+
+    @override
+    async def patch_user(self, user_id: str, patch: UserPatch) -> User | None:
+        """Apply a validated patch to a user.
+
+        Args:
+            user_id: The ID of the user to patch.
+            patch: The already validated properties to change.
+
+        Returns:
+            The user as it was before the patch, or None if not found.
+        """
+        _ = self._in_flight.pop(user_id, None)
+        try:
+            return await self._inner.patch_user(user_id, patch)
+        finally:
+            _ = self._in_flight.pop(user_id, None)
+
+    @override
+    async def delete_user(self, user_id: str) -> None:
+        """Delete a user by their ID.
+
+        Args:
+            user_id: The ID of the user to delete.
+        """
+        _ = self._in_flight.pop(user_id, None)
+        try:
+            await self._inner.delete_user(user_id)
+        finally:
+            _ = self._in_flight.pop(user_id, None)
+
+    def _forget(self, user_id: str, lookup: asyncio.Task[User | None]) -> None:
+        """Drop a finished lookup, unless a write already replaced it.
+
+        Args:
+            user_id: The ID the lookup was for.
+            lookup: The finished lookup task.
+        """
+        if self._in_flight.get(user_id) is lookup:
+            del self._in_flight[user_id]
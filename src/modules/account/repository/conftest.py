@@ -0,0 +1,21 @@
+"""Shared fixtures for the user repository tests."""
+
+from collections.abc import Callable
+
+import pytest
+
+from src.modules.account.domain.user import User
+
+
+@pytest.fixture
+def make_user() -> Callable[[str], User]:
+    """Provide a builder for new users that differ only by email.
+
+    Returns:
+        A function building a freshly created user with the given email.
+    """
+
+    def build(email: str) -> User:
+        return User.create({"name": "John Doe", "age": 25, "email": email})
+
+    return build
@@ -0,0 +1,142 @@
+"""Unit tests for the CoalescingUserRepository."""
+
+import asyncio
+from collections.abc import Callable
+from typing import override
+
+from src.modules.account.domain.user import User, UserPatch
+from src.modules.account.repository.coalescing_user_repository import (
+    CoalescingUserRepository,
+)
+from src.modules.account.repository.user_repository import InMemoryUserRepository
+
+
+class GatedUserRepository(InMemoryUserRepository):
+    """In-memory repository whose reads and writes block until released.
+
+    A read takes its snapshot before waiting, like a database response
+    still travelling back, so a slow read can return the state from before
+    a write that completes in the meantime. Writes are released by default.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the repository with a closed read gate and no reads."""
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.write_gate = asyncio.Event()
+        self.write_gate.set()
+        self.reads = 0
+
+    @override
+    async def get_user_by_id(self, user_id: str) -> User | None:
+        """Count the read and wait for the gate before answering.
+
+        Args:
+            user_id: The ID of the user to retrieve.
+
+        Returns:
+            The User object if found, otherwise None.
+        """
+        self.reads += 1
+        user = await super().get_user_by_id(user_id)
+        _ = await self.gate.wait()
+        return user
+
+    @override
+    async def patch_user(self, user_id: str, patch: UserPatch) -> User | None:
+        """Wait for the write gate, then apply the patch.
+
+        Args:
+            user_id: The ID of the user to patch.
+            patch: The already validated properties to change.
+
+        Returns:
+            A copy of the user as it was before the patch, or None if not
+            found.
+        """
+        _ = await self.write_gate.wait()
+        return await super().patch_user(user_id, patch)
+
+
+class TestCoalescingUserRepository:
+    """Unit tests for the CoalescingUserRepository."""
+
+    def test_concurrent_reads_share_one_lookup(self, make_user: Callable[[str], User]):
+        """Test that concurrent reads of one user hit the inner repository once."""
+
+        async def scenario() -> None:
+            inner = GatedUserRepository()
+            repository = CoalescingUserRepository(inner)
+            user = await repository.create_user(make_user("john@example.com"))
+
+            reads = [repository.get_user_by_id(user.id_str) for _ in range(5)]
+            pending = asyncio.gather(*reads)
+            await asyncio.sleep(0)
+            inner.gate.set()
+
+            assert await pending == [user] * 5
+            assert inner.reads == 1
+
+            # Once finished, the next read starts a fresh lookup
+            assert await repository.get_user_by_id(user.id_str) == user
+            assert inner.reads == 2
+
+        asyncio.run(scenario())
+
+    def test_write_detaches_reads_started_before_it(
+        self, make_user: Callable[[str], User]
+    ):
+        """Test that a read after a write does not join an older lookup."""
+
+        async def scenario() -> None:
+            inner = GatedUserRepository()
+            repository = CoalescingUserRepository(inner)
+            user = await repository.create_user(make_user("john@example.com"))
+
+            before = asyncio.ensure_future(repository.get_user_by_id(user.id_str))
+            await asyncio.sleep(0)
+            _ = await repository.patch_user(user.id_str, {"age": 30})
+            after = asyncio.ensure_future(repository.get_user_by_id(user.id_str))
+            await asyncio.sleep(0)
+            inner.gate.set()
+
+            _ = await before
+            read_after = await after
+            assert read_after is not None
+            assert read_after.age.value == 30
+            assert inner.reads == 2
+
+        asyncio.run(scenario())
+
+    def test_write_detaches_reads_started_while_it_runs(
+        self, make_user: Callable[[str], User]
+    ):
+        """Test that a read after a write does not join a lookup it overlapped."""
+
+        async def scenario() -> None:
+            inner = GatedUserRepository()
+            repository = CoalescingUserRepository(inner)
+            user = await repository.create_user(make_user("john@example.com"))
+
+            inner.write_gate.clear()
+            write = asyncio.ensure_future(
+                repository.patch_user(user.id_str, {"age": 30})
+            )
+            await asyncio.sleep(0)
+            during = asyncio.ensure_future(repository.get_user_by_id(user.id_str))
+            await asyncio.sleep(0)
+            inner.write_gate.set()
+            _ = await write
+
+            after = asyncio.ensure_future(repository.get_user_by_id(user.id_str))
+            await asyncio.sleep(0)
+            inner.gate.set()
+
+            read_during = await during
+            read_after = await after
+            assert read_during is not None
+            assert read_during.age.value == 25
+            assert read_after is not None
+            assert read_after.age.value == 30
+
+        asyncio.run(scenario())
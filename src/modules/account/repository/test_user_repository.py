@@ -0,0 +1,58 @@
+"""Unit tests for the in-memory user repository."""
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+
+from src.modules.account.domain.user import User
+from src.modules.account.domain.value_objects.name import Name
+from src.modules.account.repository.user_repository import (
+    EmailAlreadyInUse,
+    InMemoryUserRepository,
+)
+
+
+class TestInMemoryUserRepository:
+    """Unit tests for the InMemoryUserRepository."""
+
+    def test_create_rejects_an_email_already_in_use(
+        self, make_user: Callable[[str], User]
+    ):
+        """Test that two users cannot share an email."""
+        repository = InMemoryUserRepository()
+        _ = asyncio.run(repository.create_user(make_user("john@example.com")))
+
+        with pytest.raises(EmailAlreadyInUse):
+            _ = asyncio.run(repository.create_user(make_user("john@example.com")))
+
+    def test_update_allows_a_user_to_keep_its_own_email(
+        self, make_user: Callable[[str], User]
+    ):
+        """Test that re-saving a user with its current email is not a conflict."""
+        repository = InMemoryUserRepository()
+        user = asyncio.run(repository.create_user(make_user("john@example.com")))
+
+        updated = asyncio.run(repository.update_user(user.id_str, user))
+
+        assert updated is user
+
+    def test_patch_returns_a_detached_copy_of_the_previous_user(
+        self, make_user: Callable[[str], User]
+    ):
+        """Test that the returned pre-image is not the stored user."""
+        repository = InMemoryUserRepository()
+        user = asyncio.run(repository.create_user(make_user("john@example.com")))
+
+        previous = asyncio.run(repository.patch_user(user.id_str, {"age": 30}))
+        assert previous is not None
+        assert previous.age.value == 25
+        _ = previous.apply_patch(name=Name("Jane Doe"))
+
+        stored = asyncio.run(repository.get_user_by_id(user.id_str))
+        assert stored is not None
+        assert stored.to_properties() == {
+            "name": "John Doe",
+            "age": 30,
+            "email": "john@example.com",
+        }
@@ -3,7 +3,13 @@
 from abc import ABC, abstractmethod
 from typing import override
 
-from src.modules.account.domain.user import User
+from src.modules.account.domain.user import User, UserPatch
+
+
+class EmailAlreadyInUse(Exception):
+    """Exception raised when a user is saved with another user's email."""
+
+    pass
 
 
 class AbstractUserRepository(ABC):
@@ -16,12 +22,32 @@ class AbstractUserRepository(ABC):
 
     @abstractmethod
     async def create_user(self, user_data: User) -> User:
-        """Create a new user."""
+        """Create a new user.
+
+        Raises:
+            EmailAlreadyInUse: If another user already has the same email.
+        """
         pass
 
     @abstractmethod
     async def update_user(self, user_id: str, user_data: User) -> User | None:
-        """Update an existing user."""
+        """Update an existing user.
+
+        Raises:
+            EmailAlreadyInUse: If another user already has the same email.
+        """
+        pass
+
+    @abstractmethod
+    async def patch_user(self, user_id: str, patch: UserPatch) -> User | None:
+        """Apply a validated patch to a user in a single operation.
+
+        Returns:
+            The user as it was before the patch, or None if not found.
+
+        Raises:
+            EmailAlreadyInUse: If another user already has the same email.
+        """
         pass
 
     @abstractmethod
@@ -30,7 +56,7 @@ class AbstractUserRepository(ABC):
         pass
 
 
-class MongoUserRepository(AbstractUserRepository):
+class InMemoryUserRepository(AbstractUserRepository):
     """In-memory implementation of the user repository."""
 
     def __init__(self):
@@ -59,7 +85,8 @@ class MongoUserRepository(AbstractUserRepository):
         Returns:
             The created User object.
         """
-        self.users[str(user_data.id)] = user_data
+        self._ensure_email_available(user_data)
+        self.users[user_data.id_str] = user_data
         return user_data
 
     @override
@@ -74,10 +101,36 @@ class MongoUserRepository(AbstractUserRepository):
             The updated User object if the user exists, otherwise None.
         """
         if user_id in self.users:
+            self._ensure_email_available(user_data)
             self.users[user_id] = user_data
             return user_data
         return None
 
+    @override
+    async def patch_user(self, user_id: str, patch: UserPatch) -> User | None:
+        """Apply a validated patch to a user.
+
+        Args:
+            user_id: The ID of the user to patch.
+            patch: The already validated properties to change.
+
+        Returns:
+            A copy of the user as it was before the patch, or None if not
+            found.
+        """
+        stored_user = self.users.get(user_id)
+        if stored_user is None:
+            return None
+        # Hand out a snapshot, like the persistent repository's freshly
+        # loaded document, so callers never mutate a stored user
+        previous_properties = stored_user.to_properties()
+        patched_user = User.restore(
+            user_id=stored_user.id, properties=previous_properties | patch
+        )
+        self._ensure_email_available(patched_user)
+        self.users[user_id] = patched_user
+        return User.restore(user_id=stored_user.id, properties=previous_properties)
+
     @override
     async def delete_user(self, user_id: str) -> None:
         """Delete a user by their ID.
@@ -86,3 +139,18 @@ class MongoUserRepository(AbstractUserRepository):
             user_id: The ID of the user to delete.
         """
         _ = self.users.pop(user_id, None)
+
+    def _ensure_email_available(self, user_data: User) -> None:
+        """Mirror the unique email index of the persistent repository.
+
+        Args:
+            user_data: The user about to be stored.
+
+        Raises:
+            EmailAlreadyInUse: If another user already has the same email.
+        """
+        for user in self.users.values():
+            if user.email == user_data.email and user.id != user_data.id:
+                raise EmailAlreadyInUse(
+                    f"Email '{user_data.email.value}' is already in use"
+                )
@@ -1,12 +1,20 @@
 """MongoDB implementation of the User Repository."""
 
+from functools import lru_cache
 from typing import override
 
 from beanie import PydanticObjectId
+from beanie.odm.queries.update import UpdateResponse
+from beanie.operators import Set
 from bson import ObjectId
-
-from src.modules.account.domain.user import User, UserProperties
-from src.modules.account.repository.user_repository import AbstractUserRepository
+from pymongo.errors import DuplicateKeyError
+from pymongo.results import UpdateResult
+
+from src.modules.account.domain.user import User, UserPatch
+from src.modules.account.repository.user_repository import (
+    AbstractUserRepository,
+    EmailAlreadyInUse,
+)
 from src.modules.core.infra.documents.user_document import UserDocument
 
 
@@ -16,6 +24,42 @@ class FailedToCreateUser(Exception):
     pass
 
 
+@lru_cache(maxsize=1024)
+def _object_id(user_id: str) -> ObjectId:
+    """Parse a user ID string, reusing the result for recently seen IDs.
+
+    ObjectId instances are never mutated, so the cached objects are safe
+    to share between calls.
+
+    Args:
+        user_id: The hex string form of the user ID.
+
+    Returns:
+        The parsed ObjectId.
+    """
+    return ObjectId(user_id)
+
+
+def _to_user(user_id: str, user_document: UserDocument) -> User:
+    """Restore a domain user from its stored document.
+
+    Args:
+        user_id: The hex string form of the user ID.
+        user_document: The stored user document.
+
+    Returns:
+        The restored User.
+    """
+    return User.restore(
+        user_id=_object_id(user_id),
+        properties={
+            "name": user_document.name,
+            "age": user_document.age,
+            "email": user_document.email,
+        },
+    )
+
+
 class MongoUserRepository(AbstractUserRepository):
     """MongoDB implementation of the User Repository."""
 
@@ -34,14 +78,11 @@ class MongoUserRepository(AbstractUserRepository):
             The User object if found, otherwise None.
         """
         user_document = await self.document_model.find_one(
-            UserDocument.id == ObjectId(user_id)
+            UserDocument.id == _object_id(user_id)
         )
         if not user_document:
             return None
-        properties = UserProperties(
-            name=user_document.name, age=user_document.age, email=user_document.email
-        )
-        return User.restore(user_id=ObjectId(user_document.id), properties=properties)
+        return _to_user(user_id, user_document)
 
     @override
     async def create_user(self, user_data: User) -> User:
@@ -55,14 +96,17 @@ class MongoUserRepository(AbstractUserRepository):
 
         Raises:
             FailedToCreateUser: If user creation fails.
+            EmailAlreadyInUse: If another user already has the same email.
         """
         user_document = self.document_model(
-            id=PydanticObjectId(str(user_data.id)),
-            name=user_data.name.value,
-            age=user_data.age.value,
-            email=user_data.email.value,
+            id=PydanticObjectId(user_data.id), **user_data.to_properties()
         )
-        persisted_user = await self.document_model.insert_one(user_document)
+        try:
+            persisted_user = await self.document_model.insert_one(user_document)
+        except DuplicateKeyError as error:
+            raise EmailAlreadyInUse(
+                f"Email '{user_data.email.value}' is already in use"
+            ) from error
         if not persisted_user:
             raise FailedToCreateUser("Failed to create user")
         return user_data
@@ -77,19 +121,55 @@ class MongoUserRepository(AbstractUserRepository):
 
         Returns:
             The updated User object if successful, otherwise None.
+
+        Raises:
+            EmailAlreadyInUse: If another user already has the same email.
         """
-        user_document = await self.document_model.find_one(
-            UserDocument.id == ObjectId(user_id)
-        )
-        if not user_document:
+        # Single round-trip: match and $set in one update_one command
+        try:
+            result = await self.document_model.find_one(
+                UserDocument.id == _object_id(user_id)
+            ).update(Set(user_data.to_properties()))
+        except DuplicateKeyError as error:
+            raise EmailAlreadyInUse(
+                f"Email '{user_data.email.value}' is already in use"
+            ) from error
+        if not isinstance(result, UpdateResult) or result.matched_count == 0:
             return None
+        return user_data
 
-        user_document.name = user_data.name.value
-        user_document.age = user_data.age.value
-        user_document.email = user_data.email.value
+    @override
+    async def patch_user(self, user_id: str, patch: UserPatch) -> User | None:
+        """Apply a validated patch to a user in one round trip.
 
-        await user_document.save()  # type: ignore
-        return user_data
+        Matches, updates and reads the user with a single
+        find_one_and_update, returning the document as it was before the
+        update so callers can tell what actually changed.
+
+        Args:
+            user_id: The ID of the user to patch.
+            patch: The already validated properties to change.
+
+        Returns:
+            The user as it was before the patch, or None if not found.
+
+        Raises:
+            EmailAlreadyInUse: If another user already has the same email.
+        """
+        if not patch:
+            # An empty $set is rejected by MongoDB, and there is nothing to write
+            return await self.get_user_by_id(user_id)
+        try:
+            user_document = await self.document_model.find_one(
+                UserDocument.id == _object_id(user_id)
+            ).update(Set(patch), response_type=UpdateResponse.OLD_DOCUMENT)
+        except DuplicateKeyError as error:
+            raise EmailAlreadyInUse(
+                f"Email '{patch.get('email')}' is already in use"
+            ) from error
+        if not isinstance(user_document, UserDocument):
+            return None
+        return _to_user(user_id, user_document)
 
     @override
     async def delete_user(self, user_id: str) -> None:
@@ -102,7 +182,7 @@ class MongoUserRepository(AbstractUserRepository):
             The deleted User object if successful, otherwise None.
         """
         user_document = await self.document_model.find_one(
-            UserDocument.id == ObjectId(user_id)
+            UserDocument.id == _object_id(user_id)
         )
         if not user_document:
             return None
@@ -1,6 +1,7 @@
 """Use case for creating a new user."""
 
 from dataclasses import dataclass
+from datetime import datetime
 
 from src.modules.account.domain.user import User, UserProperties
 from src.modules.account.repository.user_repository import (
@@ -9,7 +10,7 @@ from src.modules.account.repository.user_repository import (
 from src.modules.core.domain.event_dispatcher import EventDispatcher
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreateUserCommand:
     """Command to create a new user."""
 
@@ -18,7 +19,7 @@ class CreateUserCommand:
     email: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateUserUseCase:
     """Use case for creating a new user."""
 
@@ -34,12 +35,15 @@ class CreateUserUseCase:
         Returns:
             User: The newly created user entity.
         """
-        user_properties = UserProperties(
-            name=command.name, age=command.age, email=command.email
-        )
-        user = User.create(user_properties)
+        user_properties: UserProperties = {
+            "name": command.name,
+            "age": command.age,
+            "email": command.email,
+        }
+        # One timestamp per command, shared by every event it raises
+        occurred_at = datetime.now()
+        user = User.create(user_properties, occurred_at=occurred_at)
         _ = await self.user_repository.create_user(user)
         # Dispatch domain events after successful persistence
-        self.event_dispatcher.dispatch(user.domain_events)
-        user.clear_domain_events()
+        await self.event_dispatcher.dispatch(user.pull_domain_events())
         return user
@@ -3,23 +3,25 @@
 from dataclasses import dataclass
 
 from src.modules.account.repository.user_repository import AbstractUserRepository
+from src.modules.account.use_case.get_user_use_case import UserCache
 from src.modules.account.use_case.update_user_use_case import UserNotFoundException
 from src.modules.core.domain.event_dispatcher import EventDispatcher
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeleteUserCommand:
     """Command to delete a user by ID."""
 
     user_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeleteUserUseCase:
     """Use case for deleting a user by ID."""
 
     user_repository: AbstractUserRepository
     event_dispatcher: EventDispatcher
+    user_cache: UserCache
 
     async def execute(self, command: DeleteUserCommand) -> None:
         """Execute the use case to delete a user.
@@ -35,6 +37,6 @@ class DeleteUserUseCase:
             raise UserNotFoundException(f"User with ID {command.user_id} not found")
 
         await self.user_repository.delete_user(command.user_id)
+        self.user_cache.invalidate(command.user_id)
         # Dispatch domain events after successful deletion
-        self.event_dispatcher.dispatch(existing_user.domain_events)
-        existing_user.clear_domain_events()
+        await self.event_dispatcher.dispatch(existing_user.pull_domain_events())
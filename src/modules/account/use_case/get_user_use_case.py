@@ -6,34 +6,52 @@ from src.modules.account.domain.user import User
 from src.modules.account.repository.user_repository import (
     AbstractUserRepository,
 )
+from src.modules.core.infra.cache.ttl_cache import TTLCache
 
 
-@dataclass
+class UserCache(TTLCache[str, User]):
+    """Short-lived cache of users served by GetUserUseCase, keyed by user ID.
+
+    Cached users are shared between requests and must be treated as
+    read-only; commands invalidate the entry of any user they change,
+    after the change is written.
+    """
+
+
+@dataclass(frozen=True, slots=True)
 class GetUserQuery:
     """Query to retrieve a user by ID."""
 
     user_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetUserUseCase:
     """Use case for retrieving a user by ID."""
 
     user_repository: AbstractUserRepository
+    user_cache: UserCache
 
-    async def execute(self, query: GetUserQuery) -> User:
+    async def execute(self, query: GetUserQuery) -> User | None:
         """Execute the use case to retrieve a user.
 
+        Recently read users are served from the cache without a
+        repository round trip.
+
         Args:
             query: The query containing the user ID to retrieve
 
         Returns:
             User if found, None otherwise
-
-        Raises:
-            ValueError: If the user with the given ID is not found.
         """
+        cached_user = self.user_cache.get(query.user_id)
+        if cached_user is not None:
+            return cached_user
+
+        # A command invalidating the user while the read is in flight makes
+        # the cache reject what the read returns
+        token = self.user_cache.read_token()
         persisted_user = await self.user_repository.get_user_by_id(query.user_id)
-        if not persisted_user:
-            raise ValueError(f"User with ID {query.user_id} not found")
+        if persisted_user is not None:
+            self.user_cache.set(query.user_id, persisted_user, token)
         return persisted_user
@@ -0,0 +1,76 @@
+"""Unit tests for the GetUserUseCase."""
+
+import asyncio
+from typing import override
+
+from src.modules.account.domain.user import User
+from src.modules.account.repository.user_repository import InMemoryUserRepository
+from src.modules.account.use_case.get_user_use_case import (
+    GetUserQuery,
+    GetUserUseCase,
+    UserCache,
+)
+from src.modules.account.use_case.update_user_use_case import (
+    UpdateUserCommand,
+    UpdateUserUseCase,
+)
+from src.modules.core.domain.event_dispatcher import EventDispatcher
+
+
+class SlowReadUserRepository(InMemoryUserRepository):
+    """In-memory repository whose reads answer only once released."""
+
+    def __init__(self) -> None:
+        """Initialize the repository with a closed read gate."""
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    @override
+    async def get_user_by_id(self, user_id: str) -> User | None:
+        """Take a snapshot, then wait for the gate before answering.
+
+        Args:
+            user_id: The ID of the user to retrieve.
+
+        Returns:
+            The User object if found, otherwise None.
+        """
+        user = await super().get_user_by_id(user_id)
+        _ = await self.gate.wait()
+        return user
+
+
+class TestGetUserUseCase:
+    """Unit tests for the GetUserUseCase."""
+
+    def test_read_overlapping_an_update_is_not_cached(self):
+        """Test that a read started before an update cannot cache the old user."""
+
+        async def scenario() -> None:
+            repository = SlowReadUserRepository()
+            cache = UserCache(maxsize=10, ttl=60.0)
+            get_user = GetUserUseCase(user_repository=repository, user_cache=cache)
+            update_user = UpdateUserUseCase(
+                user_repository=repository,
+                event_dispatcher=EventDispatcher(),
+                user_cache=cache,
+            )
+            user = await repository.create_user(
+                User.create({
+                    "name": "John Doe",
+                    "age": 25,
+                    "email": "john@example.com",
+                })
+            )
+
+            read = asyncio.ensure_future(get_user.execute(GetUserQuery(user.id_str)))
+            await asyncio.sleep(0)
+            _ = await update_user.execute(UpdateUserCommand(user.id_str, age=40))
+            repository.gate.set()
+
+            read_user = await read
+            assert read_user is not None
+            assert read_user.age.value == 25
+            assert cache.get(user.id_str) is None
+
+        asyncio.run(scenario())
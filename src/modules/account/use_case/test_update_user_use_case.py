@@ -0,0 +1,157 @@
+"""Unit tests for the UpdateUserUseCase."""
+
+import asyncio
+from typing import Any, override
+
+import pytest
+
+from src.modules.account.domain.events import UserEmailChanged
+from src.modules.account.domain.user import User, UserPatch
+from src.modules.account.repository.user_repository import InMemoryUserRepository
+from src.modules.account.use_case.get_user_use_case import UserCache
+from src.modules.account.use_case.update_user_use_case import (
+    UpdateUserCommand,
+    UpdateUserUseCase,
+    UserNotFoundException,
+)
+from src.modules.core.domain.event_dispatcher import EventDispatcher
+
+
+class CountingUserRepository(InMemoryUserRepository):
+    """In-memory repository that counts patch writes."""
+
+    def __init__(self) -> None:
+        """Initialize the repository with no writes."""
+        super().__init__()
+        self.writes = 0
+
+    @override
+    async def patch_user(self, user_id: str, patch: UserPatch) -> User | None:
+        """Count the write and apply the patch.
+
+        Args:
+            user_id: The ID of the user to patch.
+            patch: The already validated properties to change.
+
+        Returns:
+            A copy of the user as it was before the patch, or None if not
+            found.
+        """
+        self.writes += 1
+        return await super().patch_user(user_id, patch)
+
+
+class UpdateUserFixture:
+    """Use case wired to an in-memory repository and a recording dispatcher."""
+
+    def __init__(self) -> None:
+        """Store one user and subscribe a recorder to email changes."""
+        self.repository = CountingUserRepository()
+        self.email_changes: list[UserEmailChanged] = []
+        self.cache = UserCache(maxsize=10, ttl=60.0)
+        dispatcher = EventDispatcher()
+        dispatcher.subscribe(UserEmailChanged, self._record)
+        self.use_case = UpdateUserUseCase(
+            user_repository=self.repository,
+            event_dispatcher=dispatcher,
+            user_cache=self.cache,
+        )
+        user = User.create({"name": "John Doe", "age": 25, "email": "john@example.com"})
+        self.user_id = asyncio.run(self.repository.create_user(user)).id_str
+
+    async def _record(self, event: UserEmailChanged) -> None:
+        """Record an email change event.
+
+        Args:
+            event: The event to record.
+        """
+        self.email_changes.append(event)
+
+    def update(self, **fields: Any) -> User:
+        """Run the use case for the stored user.
+
+        Args:
+            **fields: The fields to change.
+
+        Returns:
+            The updated user.
+        """
+        command = UpdateUserCommand(user_id=self.user_id, **fields)
+        return asyncio.run(self.use_case.execute(command))
+
+
+class TestUpdateUserUseCase:
+    """Unit tests for the UpdateUserUseCase."""
+
+    def test_update_applies_only_the_given_fields(self):
+        """Test that unset command fields keep their stored values."""
+        fixture = UpdateUserFixture()
+
+        user = fixture.update(age=30)
+        stored = asyncio.run(fixture.repository.get_user_by_id(fixture.user_id))
+
+        assert user.to_properties() == {
+            "name": "John Doe",
+            "age": 30,
+            "email": "john@example.com",
+        }
+        assert stored is not None
+        assert stored.to_properties() == user.to_properties()
+        assert fixture.email_changes == []
+
+    def test_update_emits_email_changed_with_the_previous_email(self):
+        """Test that a new email raises UserEmailChanged from the old one."""
+        fixture = UpdateUserFixture()
+
+        _ = fixture.update(email="new@example.com")
+
+        assert [(e.old_email, e.new_email) for e in fixture.email_changes] == [
+            ("john@example.com", "new@example.com")
+        ]
+
+    def test_empty_update_skips_the_write(self):
+        """Test that an update setting no field does not write or emit."""
+        fixture = UpdateUserFixture()
+        stored = fixture.repository.users[fixture.user_id]
+
+        _ = fixture.update()
+
+        assert fixture.repository.writes == 0
+        assert fixture.repository.users[fixture.user_id] is stored
+        assert fixture.email_changes == []
+
+    def test_same_value_update_skips_events_and_cache_invalidation(self):
+        """Test that rewriting current values neither emits nor invalidates.
+
+        The write itself still happens, since the repository reports the
+        previous state only once the patch is applied.
+        """
+        fixture = UpdateUserFixture()
+        cached = fixture.repository.users[fixture.user_id]
+        fixture.cache.set(fixture.user_id, cached)
+
+        same = fixture.update(email="john@example.com")
+
+        assert fixture.repository.writes == 1
+        assert same.to_properties() == cached.to_properties()
+        assert fixture.email_changes == []
+        assert fixture.cache.get(fixture.user_id) is cached
+
+    def test_update_rejects_invalid_values_before_writing(self):
+        """Test that validation happens before the repository is touched."""
+        fixture = UpdateUserFixture()
+
+        with pytest.raises(ValueError):
+            _ = fixture.update(name="J", email="new@example.com")
+
+        stored = asyncio.run(fixture.repository.get_user_by_id(fixture.user_id))
+        assert stored is not None
+        assert stored.email.value == "john@example.com"
+
+    def test_update_of_missing_user_raises(self):
+        """Test that updating an unknown ID raises UserNotFoundException."""
+        fixture = UpdateUserFixture()
+        fixture.user_id = "0" * 24
+
+        with pytest.raises(UserNotFoundException):
+            _ = fixture.update(age=30)
@@ -2,9 +2,12 @@
 
 from dataclasses import dataclass
 
-from src.modules.account.domain.events import UserEmailChanged
-from src.modules.account.domain.user import User, UserProperties
+from src.modules.account.domain.user import User, UserPatch
+from src.modules.account.domain.value_objects.age import Age
+from src.modules.account.domain.value_objects.email import Email
+from src.modules.account.domain.value_objects.name import Name
 from src.modules.account.repository.user_repository import AbstractUserRepository
+from src.modules.account.use_case.get_user_use_case import UserCache
 from src.modules.core.domain.event_dispatcher import EventDispatcher
 
 
@@ -14,7 +17,7 @@ class UserNotFoundException(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UpdateUserCommand:
     """Command to update an existing user."""
 
@@ -24,12 +27,13 @@ class UpdateUserCommand:
     email: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateUserUseCase:
     """Use case for updating an existing user."""
 
     user_repository: AbstractUserRepository
     event_dispatcher: EventDispatcher
+    user_cache: UserCache
 
     async def execute(self, command: UpdateUserCommand) -> User:
         """Execute the use case to update a user.
@@ -43,26 +47,47 @@ class UpdateUserUseCase:
         Raises:
             UserNotFoundException: If the user with the given ID does not exist.
         """
-        existing_user = await self.user_repository.get_user_by_id(command.user_id)
-        if not existing_user:
+        # Validate each field once, before anything is written
+        name = None if command.name is None else Name(command.name)
+        age = None if command.age is None else Age(command.age)
+        email = None if command.email is None else Email(command.email)
+        patch = _to_patch(name, age, email)
+        if patch:
+            user = await self.user_repository.patch_user(command.user_id, patch)
+        else:
+            # Nothing to write, so a plain read is enough
+            user = await self.user_repository.get_user_by_id(command.user_id)
+        if user is None:
             raise UserNotFoundException(f"User with ID {command.user_id} not found")
 
-        updated_properties = UserProperties(
-            name=command.name if command.name is not None else existing_user.name.value,
-            age=command.age if command.age is not None else existing_user.age.value,
-            email=command.email
-            if command.email is not None
-            else existing_user.email.value,
-        )
-
-        updated_user = User.restore(
-            user_id=existing_user.id, properties=updated_properties
-        )
-
-        _ = await self.user_repository.update_user(
-            user_id=command.user_id, user_data=updated_user
-        )
+        # The repository returns the state before the write; replaying the
+        # patch on it tells which fields really changed, and lets the entity
+        # raise events only for those.
+        if not user.apply_patch(name=name, age=age, email=email):
+            return user
+
+        self.user_cache.invalidate(command.user_id)
         # Dispatch domain events after successful persistence
-        self.event_dispatcher.dispatch(updated_user.domain_events)
-        updated_user.clear_domain_events()
-        return updated_user
+        await self.event_dispatcher.dispatch(user.pull_domain_events())
+        return user
+
+
+def _to_patch(name: Name | None, age: Age | None, email: Email | None) -> UserPatch:
+    """Collect the primitive values of the fields to change.
+
+    Args:
+        name: The validated new name, if any.
+        age: The validated new age, if any.
+        email: The validated new email, if any.
+
+    Returns:
+        UserPatch: Only the fields that are set.
+    """
+    patch: UserPatch = {}
+    if name is not None:
+        patch["name"] = name.value
+    if age is not None:
+        patch["age"] = age.value
+    if email is not None:
+        patch["email"] = email.value
+    return patch
@@ -12,7 +12,7 @@ from uuid import UUID
 from bson import ObjectId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainEvent(ABC):
     """Base class for all domain events.
 
@@ -8,11 +8,11 @@ from bson import ObjectId
 from .domain_event import DomainEvent
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Entity:
     """Base class for domain entities with identity and domain event support.
 
-    Entities are distinguished by their identity (UUID) rather than their attributes.
+    Entities are distinguished by their identity (ObjectId) rather than their attributes.
     Two entities with the same ID are considered equal, even if their other attributes differ.
 
     This base class provides:
@@ -21,12 +21,18 @@ class Entity:
     - Proper equality and hashing based on identity
 
     Attributes:
-        id: Unique identifier for the entity, automatically generated
-        _domain_events: Internal list of domain events to be dispatched
+        id: Unique identifier for the entity, automatically generated. It may
+            only be replaced right after construction, as restore does, and
+            must not change once the entity has been hashed or its id_str
+            read, since both are cached
+        _domain_events: Internal list of domain events to be dispatched, or None
+            until the first event is added
+        _id_str: Cached string form of the ID, filled on first access
+        _hash: Cached hash of the ID, filled on first hash
 
     Example:
         ```python
-        @dataclass
+        @dataclass(eq=False, slots=True)
         class User(Entity):
             name: str
             email: str
@@ -37,7 +43,12 @@ class Entity:
     """
 
     id: ObjectId = field(default_factory=ObjectId, init=False)
-    _domain_events: list[DomainEvent] = field(default_factory=list, init=False)
+    # Created on the first event, since most entities (e.g. reads) raise none
+    _domain_events: list[DomainEvent] | None = field(
+        default=None, init=False, repr=False
+    )
+    _id_str: str | None = field(default=None, init=False, repr=False, compare=False)
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def add_domain_event(self, event: DomainEvent) -> None:
         """Add a domain event to be dispatched later.
@@ -55,7 +66,10 @@ class Entity:
             user.add_domain_event(UserCreatedEvent(user.id, user.name))
             ```
         """
-        self._domain_events.append(event)
+        if self._domain_events is None:
+            self._domain_events = [event]
+        else:
+            self._domain_events.append(event)
 
     def clear_domain_events(self) -> None:
         """Clear all domain events.
@@ -69,35 +83,69 @@ class Entity:
             user.clear_domain_events()
             ```
         """
-        self._domain_events.clear()
+        self._domain_events = None
+
+    def pull_domain_events(self) -> list[DomainEvent]:
+        """Take all collected domain events, leaving the entity with none.
+
+        Hands over the internal list instead of copying it and clearing it
+        afterwards, so collecting events for dispatch is a single swap.
+
+        Returns:
+            The domain events collected so far, in the order they were added.
+
+        Example:
+            ```python
+            # After persisting the entity
+            await event_dispatcher.dispatch(user.pull_domain_events())
+            ```
+        """
+        events, self._domain_events = self._domain_events, None
+        return events if events is not None else []
 
     @property
     def domain_events(self) -> list[DomainEvent]:
-        """Get a copy of all domain events.
+        """A copy of all domain events.
 
         Returns a copy to prevent external modification of the internal
-        event collection. Use add_domain_event() to add new events.
+        event collection. Use add_domain_event() to add new events, and
+        pull_domain_events() to take them for dispatch without copying.
 
         Returns:
             A copy of all domain events currently collected
 
         Example:
             ```python
-            events = user.domain_events
-            for event in events:
-                event_dispatcher.dispatch(event)
-            user.clear_domain_events()
+            assert any(isinstance(e, UserCreated) for e in user.domain_events)
             ```
         """
-        return self._domain_events.copy()
+        return self._domain_events.copy() if self._domain_events is not None else []
+
+    @property
+    def id_str(self) -> str:
+        """The entity ID as a hexadecimal string.
+
+        Computed once and cached on the entity, since converting an ObjectId
+        to a string re-encodes its 12 bytes every time, so the ID must not be
+        reassigned after the first access.
+
+        Returns:
+            The string form of the entity ID.
+        """
+        if self._id_str is None:
+            self._id_str = str(self.id)
+        return self._id_str
 
     @override
     def __eq__(self, other: object) -> bool:
         """Check equality based on entity identity.
 
-        Two entities are equal if they are of the same type and have the same ID.
+        Two entities are equal if they are of exactly the same type and have the
+        same ID.
         This implements the DDD concept that entities are distinguished by identity,
-        not by their attributes.
+        not by their attributes. Since an ID identifies one aggregate of one
+        type, an instance of a subclass is never equal to an instance of its
+        parent class, even when both carry the same ID.
 
         Args:
             other: Object to compare with
@@ -107,15 +155,18 @@ class Entity:
 
         Example:
             ```python
-            user1 = User(name="John", email="john@example.com")
-            user2 = User(name="Jane", email="jane@example.com")
-            user2.id = user1.id  # Same ID
+            user1 = User.create({"name": "John", "age": 30, "email": "john@example.com"})
+            user2 = User.restore(
+                user1.id, {"name": "Jane", "age": 25, "email": "jane@example.com"}
+            )
             assert user1 == user2  # True, despite different attributes
             ```
         """
-        if not isinstance(other, type(self)):
+        if type(other) is not type(self):
             return NotImplemented
-        return self.id == other.id
+        # Copies restored from the same ID usually share one ObjectId instance
+        self_id, other_id = self.id, other.id
+        return self_id is other_id or self_id == other_id
 
     @override
     def __hash__(self) -> int:
@@ -123,7 +174,8 @@ class Entity:
 
         The hash is based solely on the entity's ID, ensuring that entities
         with the same identity have the same hash value, making them suitable
-        for use in sets and as dictionary keys.
+        for use in sets and as dictionary keys. It is computed once and cached,
+        like id_str, so the ID must not be reassigned after the first hash.
 
         Returns:
             Hash value based on the entity's ID
@@ -135,4 +187,6 @@ class Entity:
             user_dict = {user: "some_value"}  # Can be used as dict keys
             ```
         """
-        return hash(self.id)
+        if self._hash is None:
+            self._hash = hash(self.id)
+        return self._hash
@@ -4,80 +4,324 @@ This module provides infrastructure for dispatching domain events
 to registered handlers, enabling decoupled event-driven architecture.
 """
 
-from typing import Protocol
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from contextlib import suppress
+from typing import Any, override
 
 from src.modules.core.domain.domain_event import DomainEvent
 
+logger = logging.getLogger(__name__)
 
-class EventHandler(Protocol):
-    """Protocol for event handlers.
+type EventCallback = Callable[[Any], Awaitable[None]]
+"""Coroutine function awaited with each dispatched event of its type."""
 
-    Event handlers must implement the handle method to process
-    domain events they are interested in.
-    """
-
-    def handle(self, event: DomainEvent) -> None:
-        """Handle a domain event.
-
-        Args:
-            event: The domain event to handle.
-        """
-        ...
+type BatchEventCallback = Callable[[list[Any]], Awaitable[None]]
+"""Coroutine function awaited once with all dispatched events of its type."""
 
 
 class EventDispatcher:
-    """Dispatches domain events to registered handlers.
+    """Dispatches domain events to registered callbacks.
 
     Provides a simple publish-subscribe mechanism for domain events,
-    allowing multiple handlers to react to the same event.
+    allowing multiple callbacks to react to the same event. A callback
+    subscribed to an event type also receives events of its subclasses,
+    so one subscribed to DomainEvent sees every event.
     """
 
     def __init__(self) -> None:
         """Initialize the event dispatcher."""
-        self._handlers: dict[type[DomainEvent], list[EventHandler]] = {}
+        self._handlers: defaultdict[type[DomainEvent], list[EventCallback]] = (
+            defaultdict(list)
+        )
+        self._batch_handlers: defaultdict[
+            type[DomainEvent], list[BatchEventCallback]
+        ] = defaultdict(list)
+        # Callbacks resolved along each dispatched class's MRO, filled on
+        # first dispatch of that class and dropped whenever any
+        # subscription changes.
+        self._dispatch_table: dict[type[DomainEvent], tuple[EventCallback, ...]] = {}
+        self._batch_dispatch_table: dict[
+            type[DomainEvent], tuple[BatchEventCallback, ...]
+        ] = {}
+        self._frozen = False
+
+    def subscribe[E: DomainEvent](
+        self, event_type: type[E], callback: Callable[[E], Awaitable[None]]
+    ) -> None:
+        """Subscribe a callback to an event type.
+
+        Args:
+            event_type: The type of event to subscribe to.
+            callback: The callable that will process the event.
+        """
+        self._ensure_not_frozen()
+        self._handlers[event_type].append(callback)
+        self._drop_resolved()
 
-    def subscribe(self, event_type: type[DomainEvent], handler: EventHandler) -> None:
-        """Subscribe a handler to an event type.
+    def subscribe_batch[E: DomainEvent](
+        self, event_type: type[E], callback: Callable[[list[E]], Awaitable[None]]
+    ) -> None:
+        """Subscribe a callback that receives an event type in batches.
+
+        The callback is awaited once per dispatch with every event of that
+        type, in dispatch order, so it can persist or forward them in a
+        single round trip.
 
         Args:
             event_type: The type of event to subscribe to.
-            handler: The handler that will process the event.
+            callback: The callable that will process each batch of events.
         """
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        self._ensure_not_frozen()
+        self._batch_handlers[event_type].append(callback)
+        self._drop_resolved()
 
-    def dispatch(self, events: list[DomainEvent]) -> None:
-        """Dispatch a list of events to their registered handlers.
+    def bulk_subscribe(
+        self, subscriptions: Mapping[type[DomainEvent], Iterable[EventCallback]]
+    ) -> None:
+        """Subscribe several callbacks to several event types at once.
+
+        Args:
+            subscriptions: Mapping of event types to the callbacks that will
+                process them, in the order they are started.
+        """
+        self._ensure_not_frozen()
+        for event_type, callbacks in subscriptions.items():
+            self._handlers[event_type].extend(callbacks)
+        self._drop_resolved()
+
+    def freeze(self) -> None:
+        """Lock the subscriptions once configuration is complete.
+
+        Resolved callbacks are cached per event class; freezing guarantees
+        the cache never goes stale, so any later attempt to change the
+        subscriptions fails loudly.
+        """
+        self._frozen = True
+
+    async def dispatch(self, events: list[DomainEvent]) -> None:
+        """Dispatch a list of events to their registered callbacks.
+
+        All callbacks for all events run concurrently, so dispatch takes as
+        long as the slowest callback rather than the sum of all of them. A
+        failing callback is logged and does not affect the others. Batch
+        callbacks are awaited once with all events of their type.
+
+        Each callback is started for its events in dispatch order, but since
+        they run concurrently, a callback that awaits may finish them in any
+        order.
 
         Args:
             events: List of domain events to dispatch.
         """
-        print(f"Dispatching {len(events)} events")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dispatching %d events", len(events))
+        # Group once so the callbacks are resolved per type, not per event
+        batches: dict[type[DomainEvent], list[DomainEvent]] = {}
+        get_batch = batches.get
         for event in events:
-            handlers = self._handlers.get(type(event), [])
-            for handler in handlers:
-                handler.handle(event)
+            event_type = event.__class__
+            batch = get_batch(event_type)
+            if batch is None:
+                batches[event_type] = [event]
+            else:
+                batch.append(event)
 
-    def dispatch_single(self, event: DomainEvent) -> None:
-        """Dispatch a single event to its registered handlers.
+        # The tables are only ever cleared in place, so binding their lookups
+        # up front stays valid while _resolve fills them below
+        get_callbacks = self._dispatch_table.get
+        batch_table = self._batch_dispatch_table
+        pending: list[Awaitable[None]] = []
+        schedule = pending.extend
+        for event_type, batch in batches.items():
+            callbacks = get_callbacks(event_type)
+            if callbacks is None:
+                callbacks = self._resolve(event_type)
+            if callbacks:
+                schedule(callback(event) for event in batch for callback in callbacks)
+            batch_callbacks = batch_table[event_type]
+            if batch_callbacks:
+                schedule(callback(batch) for callback in batch_callbacks)
+        if not pending:
+            return
+
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("Event callback failed", exc_info=result)
+
+    async def dispatch_single(self, event: DomainEvent) -> None:
+        """Dispatch a single event to its registered callbacks.
 
         Args:
             event: The domain event to dispatch.
         """
-        self.dispatch([event])
+        await self.dispatch([event])
 
     def clear_handlers(self) -> None:
-        """Clear all registered handlers."""
+        """Clear all registered callbacks."""
+        self._ensure_not_frozen()
         self._handlers.clear()
+        self._batch_handlers.clear()
+        self._drop_resolved()
+
+    def _ensure_not_frozen(self) -> None:
+        """Reject subscription changes after the dispatcher is frozen.
+
+        Raises:
+            RuntimeError: If the dispatcher has been frozen.
+        """
+        if self._frozen:
+            raise RuntimeError("Cannot change subscriptions of a frozen dispatcher")
+
+    def _resolve(self, event_type: type[DomainEvent]) -> tuple[EventCallback, ...]:
+        """Collect and cache the callbacks for an event class.
+
+        Walks the class's MRO from the most specific class outwards, so
+        callbacks on a subclass start before those on its bases, each group in
+        subscription order.
+
+        Args:
+            event_type: The concrete class of the dispatched events.
+
+        Returns:
+            The per-event callbacks for that class.
+        """
+        mro = event_type.__mro__
+        callbacks = tuple(
+            callback for cls in mro for callback in self._handlers.get(cls, ())
+        )
+        self._dispatch_table[event_type] = callbacks
+        self._batch_dispatch_table[event_type] = tuple(
+            callback for cls in mro for callback in self._batch_handlers.get(cls, ())
+        )
+        return callbacks
+
+    def _drop_resolved(self) -> None:
+        """Forget every resolved callback tuple after a subscription change."""
+        self._dispatch_table.clear()
+        self._batch_dispatch_table.clear()
 
     def get_handler_count(self, event_type: type[DomainEvent]) -> int:
-        """Get the number of handlers registered for an event type.
+        """Get the number of callbacks registered for an event type.
 
         Args:
             event_type: The event type to check.
 
         Returns:
-            The number of registered handlers.
+            The number of registered callbacks.
+        """
+        return len(self._handlers.get(event_type, ())) + len(
+            self._batch_handlers.get(event_type, ())
+        )
+
+
+class AsyncQueueEventDispatcher(EventDispatcher):
+    """Event dispatcher that runs callbacks in a background task.
+
+    While the worker is running, dispatch only enqueues the events, so
+    handler latency stays out of the request that raised them. The worker
+    drains the queue, delivering everything queued at that point in one
+    concurrent batch. Without a running worker, events are delivered
+    inline like the base dispatcher does.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the dispatcher with no running worker."""
+        super().__init__()
+        self._queue: asyncio.Queue[DomainEvent] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    @override
+    async def dispatch(self, events: list[DomainEvent]) -> None:
+        """Enqueue events for the background worker.
+
+        Args:
+            events: List of domain events to dispatch.
+        """
+        if self._queue is None:
+            await super().dispatch(events)
+            return
+        for event in events:
+            self._queue.put_nowait(event)
+
+    def start(self) -> None:
+        """Start the background worker on the running event loop.
+
+        The queue is created here rather than in __init__, since an asyncio
+        queue is bound to the loop it is first used on.
+
+        Raises:
+            RuntimeError: If the worker is already running.
+        """
+        if self._worker is not None:
+            raise RuntimeError("Event dispatcher worker is already running")
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._drain(self._queue))
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Deliver every queued event, then stop the background worker.
+
+        Args:
+            timeout: Seconds to wait for queued events before giving up on
+                them, so a hung callback cannot block shutdown.
+        """
+        if self._queue is None or self._worker is None:
+            return
+        queue, worker = self._queue, self._worker
+        try:
+            if worker.done():
+                self._report_dead_worker(worker, queue)
+                return
+            try:
+                await asyncio.wait_for(queue.join(), timeout)
+            except TimeoutError:
+                logger.error(
+                    "Dropped %d undelivered events after %.1fs",
+                    queue.qsize(),
+                    timeout,
+                )
+            _ = worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await worker
+        finally:
+            self._queue = None
+            self._worker = None
+
+    async def _drain(self, queue: asyncio.Queue[DomainEvent]) -> None:
+        """Deliver queued events until cancelled.
+
+        Args:
+            queue: The queue filled by dispatch.
+        """
+        while True:
+            events = [await queue.get()]
+            while not queue.empty():
+                events.append(queue.get_nowait())
+            try:
+                await super().dispatch(events)
+            except Exception:
+                # Keep the worker alive, or later events would pile up unseen
+                logger.exception("Dispatching %d queued events failed", len(events))
+            finally:
+                for _ in events:
+                    queue.task_done()
+
+    @staticmethod
+    def _report_dead_worker(
+        worker: asyncio.Task[None], queue: asyncio.Queue[DomainEvent]
+    ) -> None:
+        """Log why the worker stopped early and what it left undelivered.
+
+        Args:
+            worker: The finished worker task.
+            queue: The queue the worker was draining.
         """
-        return len(self._handlers.get(event_type, []))
+        error = None if worker.cancelled() else worker.exception()
+        logger.error(
+            "Event dispatcher worker stopped early; dropped %d undelivered events",
+            queue.qsize(),
+            exc_info=error,
+        )
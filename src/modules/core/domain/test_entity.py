@@ -0,0 +1,113 @@
+"""Unit tests for the Entity base class in the core domain."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from bson import ObjectId
+
+from src.modules.core.domain.domain_event import DomainEvent
+from src.modules.core.domain.entity import Entity
+
+
+@dataclass(frozen=True, slots=True)
+class SampleEvent(DomainEvent):
+    """Event raised by the sample entity."""
+
+
+@dataclass(eq=False, slots=True)
+class SampleEntity(Entity):
+    """Minimal concrete entity used to exercise the base class."""
+
+    name: str
+
+
+@dataclass(eq=False, slots=True)
+class SpecialEntity(SampleEntity):
+    """Subclass used to check that equality requires the exact same type."""
+
+
+def raise_event(entity: Entity) -> DomainEvent:
+    """Add a new event to the entity.
+
+    Args:
+        entity: The entity that raises the event.
+
+    Returns:
+        The event that was added.
+    """
+    event = SampleEvent(aggregate_id=entity.id, occurred_at=datetime.now())
+    entity.add_domain_event(event)
+    return event
+
+
+class TestEntity:
+    """Unit tests for the Entity base class."""
+
+    def test_pull_domain_events_returns_events_and_empties_the_entity(self):
+        """Test that pulling hands over the events in order, exactly once."""
+        entity = SampleEntity(name="sample")
+        first, second = raise_event(entity), raise_event(entity)
+
+        assert entity.pull_domain_events() == [first, second]
+        assert entity.pull_domain_events() == []
+        assert entity.domain_events == []
+
+    def test_pulled_list_is_detached_from_the_entity(self):
+        """Test that events raised after a pull do not leak into the pulled list."""
+        entity = SampleEntity(name="sample")
+        first = raise_event(entity)
+
+        pulled = entity.pull_domain_events()
+        second = raise_event(entity)
+
+        assert pulled == [first]
+        assert entity.domain_events == [second]
+
+    def test_entity_without_events_reports_none(self):
+        """Test that an entity that never raised events has nothing to pull."""
+        entity = SampleEntity(name="sample")
+
+        assert entity.domain_events == []
+        assert entity.pull_domain_events() == []
+
+    def test_clear_domain_events_discards_pending_events(self):
+        """Test that cleared events are not handed out afterwards."""
+        entity = SampleEntity(name="sample")
+        _ = raise_event(entity)
+
+        entity.clear_domain_events()
+
+        assert entity.pull_domain_events() == []
+
+    def test_domain_events_returns_a_copy(self):
+        """Test that mutating the domain_events result leaves the entity intact."""
+        entity = SampleEntity(name="sample")
+        event = raise_event(entity)
+
+        entity.domain_events.clear()
+
+        assert entity.domain_events == [event]
+
+    def test_hash_is_stable_and_follows_the_id(self):
+        """Test that equal entities hash alike across repeated calls."""
+        entity = SampleEntity(name="sample")
+        twin = SampleEntity(name="twin")
+        twin.id = entity.id
+
+        assert hash(entity) == hash(entity) == hash(entity.id)
+        assert hash(twin) == hash(entity)
+        assert {entity, twin} == {entity}
+
+    def test_equality_requires_the_same_id_and_exact_type(self):
+        """Test that only same-type entities sharing an ID compare equal."""
+        entity = SampleEntity(name="sample")
+        copy = SampleEntity(name="copy")
+        copy.id = ObjectId(str(entity.id))
+        special = SpecialEntity(name="special")
+        special.id = entity.id
+
+        assert entity == copy
+        assert entity != SampleEntity(name="sample")
+        assert entity != special
+        assert special != entity
+        assert entity != entity.id
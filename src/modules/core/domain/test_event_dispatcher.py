@@ -0,0 +1,344 @@
+"""Unit tests for the EventDispatcher in the core domain."""
+
+import asyncio
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from src.modules.core.domain.domain_event import DomainEvent
+from src.modules.core.domain.event_dispatcher import (
+    AsyncQueueEventDispatcher,
+    EventCallback,
+    EventDispatcher,
+)
+
+
+@dataclass(frozen=True)
+class SampleEvent(DomainEvent):
+    """Event used to exercise the dispatcher."""
+
+
+@dataclass(frozen=True)
+class OtherEvent(DomainEvent):
+    """Second event type used to check routing."""
+
+
+class RecordingHandler:
+    """Handler that records every event it receives."""
+
+    def __init__(self) -> None:
+        """Initialize the handler with an empty record."""
+        self.received: list[DomainEvent] = []
+
+    async def handle(self, event: DomainEvent) -> None:
+        """Record the event.
+
+        Args:
+            event: The domain event to record.
+        """
+        self.received.append(event)
+
+
+def make_event(event_type: type[DomainEvent] = SampleEvent) -> DomainEvent:
+    """Build an event of the given type with a fresh aggregate ID.
+
+    Args:
+        event_type: The concrete event class to instantiate.
+
+    Returns:
+        A new event instance.
+    """
+    return event_type(aggregate_id=ObjectId(), occurred_at=datetime.now())
+
+
+class TestEventDispatcher:
+    """Unit tests for the EventDispatcher."""
+
+    def test_dispatch_routes_events_to_subscribed_handlers(self):
+        """Test that callbacks only receive events of their subscribed type."""
+        dispatcher = EventDispatcher()
+        sample_handler = RecordingHandler()
+        other_handler = RecordingHandler()
+        dispatcher.subscribe(SampleEvent, sample_handler.handle)
+        dispatcher.subscribe(OtherEvent, other_handler.handle)
+
+        sample, other = make_event(SampleEvent), make_event(OtherEvent)
+        asyncio.run(dispatcher.dispatch([sample, other]))
+
+        assert sample_handler.received == [sample]
+        assert other_handler.received == [other]
+
+    def test_dispatch_starts_callbacks_in_event_order_within_each_type(self):
+        """Test that each callback is started for its events in dispatch order."""
+        dispatcher = EventDispatcher()
+        sample_handler = RecordingHandler()
+        other_handler = RecordingHandler()
+        dispatcher.subscribe(SampleEvent, sample_handler.handle)
+        dispatcher.subscribe(OtherEvent, other_handler.handle)
+
+        first, other, second = (
+            make_event(SampleEvent),
+            make_event(OtherEvent),
+            make_event(SampleEvent),
+        )
+        asyncio.run(dispatcher.dispatch([first, other, second]))
+
+        assert sample_handler.received == [first, second]
+        assert other_handler.received == [other]
+
+    def test_dispatch_guarantees_start_order_not_completion_order(self):
+        """Test that awaiting callbacks start in order but may finish out of it."""
+        dispatcher = EventDispatcher()
+        started: list[DomainEvent] = []
+        finished: list[DomainEvent] = []
+        first, second = make_event(), make_event()
+        delays = {first: 0.02, second: 0.0}
+
+        async def slow_for_first(event: DomainEvent) -> None:
+            started.append(event)
+            await asyncio.sleep(delays[event])
+            finished.append(event)
+
+        dispatcher.subscribe(SampleEvent, slow_for_first)
+        asyncio.run(dispatcher.dispatch([first, second]))
+
+        assert started == [first, second]
+        assert finished == [second, first]
+
+    def test_base_class_callbacks_receive_subclass_events(self):
+        """Test that callbacks on a base event type see all of its subclasses."""
+        dispatcher = EventDispatcher()
+        calls: list[str] = []
+
+        async def on_sample(event: SampleEvent) -> None:
+            calls.append("sample")
+
+        async def on_any(event: DomainEvent) -> None:
+            calls.append(f"any:{type(event).__name__}")
+
+        dispatcher.subscribe(DomainEvent, on_any)
+        dispatcher.subscribe(SampleEvent, on_sample)
+        asyncio.run(dispatcher.dispatch([make_event(SampleEvent)]))
+        asyncio.run(dispatcher.dispatch([make_event(OtherEvent)]))
+
+        assert calls == ["sample", "any:SampleEvent", "any:OtherEvent"]
+
+    def test_subscribing_after_dispatch_takes_effect(self):
+        """Test that new subscriptions are seen by later dispatches."""
+        dispatcher = EventDispatcher()
+        first, second = RecordingHandler(), RecordingHandler()
+        dispatcher.subscribe(SampleEvent, first.handle)
+        asyncio.run(dispatcher.dispatch([make_event()]))
+
+        dispatcher.subscribe(DomainEvent, second.handle)
+        event = make_event()
+        asyncio.run(dispatcher.dispatch([event]))
+
+        assert len(first.received) == 2
+        assert second.received == [event]
+
+    def test_dispatch_without_handlers_is_a_no_op(self):
+        """Test that events with no subscribers are silently ignored."""
+        dispatcher = EventDispatcher()
+
+        asyncio.run(dispatcher.dispatch([make_event()]))
+
+        assert dispatcher.get_handler_count(SampleEvent) == 0
+
+    def test_bulk_subscribe_registers_handlers_in_order(self):
+        """Test that bulk_subscribe keeps callback order per event type."""
+        dispatcher = EventDispatcher()
+        calls: list[str] = []
+
+        class NamedHandler:
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+            async def handle(self, event: DomainEvent) -> None:
+                calls.append(self.name)
+
+        callbacks: list[EventCallback] = [
+            NamedHandler("first").handle,
+            NamedHandler("second").handle,
+        ]
+        dispatcher.bulk_subscribe({SampleEvent: callbacks, OtherEvent: callbacks})
+        asyncio.run(
+            dispatcher.dispatch([make_event(SampleEvent), make_event(OtherEvent)])
+        )
+
+        assert calls == ["first", "second", "first", "second"]
+        assert dispatcher.get_handler_count(SampleEvent) == 2
+        assert dispatcher.get_handler_count(OtherEvent) == 2
+
+    def test_bulk_subscribe_extends_existing_subscriptions(self):
+        """Test that bulk_subscribe keeps callbacks registered earlier."""
+        dispatcher = EventDispatcher()
+        dispatcher.subscribe(SampleEvent, RecordingHandler().handle)
+
+        dispatcher.bulk_subscribe({SampleEvent: [RecordingHandler().handle]})
+
+        assert dispatcher.get_handler_count(SampleEvent) == 2
+        assert dispatcher.get_handler_count(OtherEvent) == 0
+
+    def test_frozen_dispatcher_rejects_new_subscriptions(self):
+        """Test that subscriptions cannot change after freeze."""
+        dispatcher = EventDispatcher()
+        handler = RecordingHandler()
+        dispatcher.subscribe(SampleEvent, handler.handle)
+        dispatcher.freeze()
+
+        with pytest.raises(RuntimeError):
+            dispatcher.subscribe(OtherEvent, RecordingHandler().handle)
+        with pytest.raises(RuntimeError):
+            dispatcher.bulk_subscribe({OtherEvent: [RecordingHandler().handle]})
+        with pytest.raises(RuntimeError):
+            dispatcher.clear_handlers()
+
+        event = make_event()
+        asyncio.run(dispatcher.dispatch([event]))
+        assert handler.received == [event]
+
+    def test_failing_callback_does_not_stop_the_others(self):
+        """Test that a raising callback is isolated from its siblings."""
+        dispatcher = EventDispatcher()
+        handler = RecordingHandler()
+
+        async def fail(event: DomainEvent) -> None:
+            raise RuntimeError("boom")
+
+        dispatcher.subscribe(SampleEvent, fail)
+        dispatcher.subscribe(SampleEvent, handler.handle)
+
+        event = make_event()
+        asyncio.run(dispatcher.dispatch([event]))
+
+        assert handler.received == [event]
+
+    def test_batch_callback_receives_all_events_of_its_type_at_once(self):
+        """Test that a batch callback is awaited once per dispatch and type."""
+        dispatcher = EventDispatcher()
+        batches: list[list[SampleEvent]] = []
+
+        async def record_batch(events: list[SampleEvent]) -> None:
+            batches.append(events)
+
+        dispatcher.subscribe_batch(SampleEvent, record_batch)
+
+        first, other, second = (
+            make_event(SampleEvent),
+            make_event(OtherEvent),
+            make_event(SampleEvent),
+        )
+        asyncio.run(dispatcher.dispatch([first, other, second]))
+        asyncio.run(dispatcher.dispatch([other]))
+
+        assert batches == [[first, second]]
+        assert dispatcher.get_handler_count(SampleEvent) == 1
+
+
+class TestAsyncQueueEventDispatcher:
+    """Unit tests for the AsyncQueueEventDispatcher."""
+
+    def test_dispatch_defers_delivery_to_the_worker(self):
+        """Test that dispatch only enqueues and stop delivers pending events."""
+        dispatcher = AsyncQueueEventDispatcher()
+        handler = RecordingHandler()
+        dispatcher.subscribe(SampleEvent, handler.handle)
+        events = [make_event(), make_event()]
+
+        async def scenario() -> None:
+            dispatcher.start()
+            await dispatcher.dispatch(events)
+            assert handler.received == []
+            await dispatcher.stop()
+
+        asyncio.run(scenario())
+
+        assert handler.received == events
+
+    def test_dispatch_without_worker_delivers_inline(self):
+        """Test that events are delivered directly while no worker runs."""
+        dispatcher = AsyncQueueEventDispatcher()
+        handler = RecordingHandler()
+        dispatcher.subscribe(SampleEvent, handler.handle)
+
+        event = make_event()
+        asyncio.run(dispatcher.dispatch([event]))
+
+        assert handler.received == [event]
+
+    def test_worker_can_restart_on_a_new_event_loop(self):
+        """Test that a stopped dispatcher can be started again in another loop."""
+        dispatcher = AsyncQueueEventDispatcher()
+        handler = RecordingHandler()
+        dispatcher.subscribe(SampleEvent, handler.handle)
+        events = [make_event(), make_event()]
+
+        async def scenario(event: DomainEvent) -> None:
+            dispatcher.start()
+            await dispatcher.dispatch([event])
+            await dispatcher.stop()
+
+        for event in events:
+            asyncio.run(scenario(event))
+
+        assert handler.received == events
+
+    def test_start_rejects_a_second_worker(self):
+        """Test that the worker cannot be started twice."""
+        dispatcher = AsyncQueueEventDispatcher()
+
+        async def scenario() -> None:
+            dispatcher.start()
+            with pytest.raises(RuntimeError):
+                dispatcher.start()
+            await dispatcher.stop()
+
+        asyncio.run(scenario())
+
+    def test_worker_survives_a_failing_dispatch(self):
+        """Test that an error escaping dispatch does not kill the worker."""
+        dispatcher = AsyncQueueEventDispatcher()
+        handler = RecordingHandler()
+        failed = asyncio.Event()
+
+        def fail(event: DomainEvent) -> Awaitable[None]:
+            failed.set()
+            raise RuntimeError("boom")
+
+        dispatcher.subscribe(OtherEvent, fail)
+        dispatcher.subscribe(SampleEvent, handler.handle)
+        event = make_event()
+
+        async def scenario() -> None:
+            dispatcher.start()
+            await dispatcher.dispatch([make_event(OtherEvent)])
+            _ = await failed.wait()
+            await dispatcher.dispatch([event])
+            await dispatcher.stop()
+
+        asyncio.run(scenario())
+
+        assert handler.received == [event]
+
+    def test_stop_gives_up_on_a_hung_callback(self):
+        """Test that stop returns after its timeout when a callback never ends."""
+        dispatcher = AsyncQueueEventDispatcher()
+
+        async def hang(event: DomainEvent) -> None:
+            await asyncio.Event().wait()
+
+        dispatcher.subscribe(SampleEvent, hang)
+
+        async def scenario() -> None:
+            dispatcher.start()
+            await dispatcher.dispatch([make_event()])
+            await dispatcher.stop(timeout=0.01)
+            # The stopped worker is fully released, so it can start again
+            dispatcher.start()
+            await dispatcher.stop()
+
+        asyncio.run(scenario())
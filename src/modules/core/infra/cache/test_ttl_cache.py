@@ -0,0 +1,108 @@
+"""Unit tests for the TTLCache in the core infrastructure."""
+
+import pytest
+
+from src.modules.core.infra.cache import ttl_cache
+from src.modules.core.infra.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Patch the cache clock with a controllable fake.
+
+    Args:
+        monkeypatch: Pytest fixture used to patch the clock.
+
+    Returns:
+        The fake clock driving the cache.
+    """
+    fake_clock = FakeClock()
+    monkeypatch.setattr(ttl_cache, "monotonic", fake_clock)
+    return fake_clock
+
+
+class TestTTLCache:
+    """Unit tests for the TTLCache."""
+
+    def test_get_returns_value_before_expiry(self, clock: FakeClock):
+        """Test that a stored value is served until its TTL elapses."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=1.0)
+        cache.set("a", 1)
+
+        clock.now = 0.5
+        assert cache.get("a") == 1
+
+    def test_get_drops_expired_value(self, clock: FakeClock):
+        """Test that an expired value is removed and reported as missing."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=1.0)
+        cache.set("a", 1)
+
+        clock.now = 1.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_set_evicts_oldest_entry_when_full(self, clock: FakeClock):
+        """Test that the oldest entry is evicted once maxsize is exceeded."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=1.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        cache.set("c", 4)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 3
+        assert cache.get("c") == 4
+
+    def test_invalidate_removes_entry(self, clock: FakeClock):
+        """Test that invalidate drops the entry and ignores missing keys."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=1.0)
+        cache.set("a", 1)
+
+        cache.invalidate("a")
+        cache.invalidate("missing")
+
+        assert cache.get("a") is None
+
+    def test_set_drops_value_loaded_before_an_invalidate(self, clock: FakeClock):
+        """Test that a value read before an invalidate is not cached after it."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=1.0)
+        stale_token = cache.read_token()
+        cache.invalidate("a")
+
+        cache.set("a", 1, stale_token)
+        assert cache.get("a") is None
+
+        cache.set("b", 2, stale_token)
+        cache.set("a", 3, cache.read_token())
+        assert cache.get("b") == 2
+        assert cache.get("a") == 3
+
+    def test_set_drops_tokens_older_than_forgotten_invalidations(
+        self, clock: FakeClock
+    ):
+        """Test that stale tokens stay rejected once their key is forgotten."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=1, ttl=1.0)
+        stale_token = cache.read_token()
+        cache.invalidate("a")
+        cache.invalidate("b")
+
+        cache.set("a", 1, stale_token)
+        assert cache.get("a") is None
+
+    @pytest.mark.parametrize("maxsize,ttl", [(0, 1.0), (1, 0.0)])
+    def test_rejects_non_positive_bounds(self, maxsize: int, ttl: float):
+        """Test that maxsize and ttl must both be positive."""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=maxsize, ttl=ttl)
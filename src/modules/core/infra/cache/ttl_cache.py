@@ -0,0 +1,118 @@
+"""Time-bounded in-memory cache module.
+
+This module provides a small TTL cache used to serve repeated reads
+without going back to the database within a short time window.
+"""
+
+from time import monotonic
+
+
+class TTLCache[K, V]:
+    """Bounded mapping whose entries expire after a fixed time-to-live.
+
+    Entries are evicted oldest-first once the cache is full. Since every
+    entry has the same TTL, the oldest entry is also the next to expire.
+
+    A read-through caller takes a token with read_token before loading a
+    value from its source and passes it to set. If the key was invalidated
+    in between, the loaded value may predate the change behind that
+    invalidation, so set drops it instead of serving it for a full TTL.
+
+    Attributes:
+        maxsize: Maximum number of entries kept at once.
+        ttl: Lifetime of an entry, in seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept at once.
+            ttl: Lifetime of an entry, in seconds.
+
+        Raises:
+            ValueError: If maxsize or ttl is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache maxsize must be positive")
+
+        if ttl <= 0:
+            raise ValueError("Cache ttl must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: dict[K, tuple[float, V]] = {}
+        # Generation of the latest invalidation per key, bounded like the
+        # entries. Once a key is forgotten, any token older than its
+        # invalidation is treated as stale for every key.
+        self._generation = 0
+        self._invalidated_at: dict[K, int] = {}
+        self._forgotten_generation = 0
+
+    def get(self, key: K) -> V | None:
+        """Get a cached value if it has not expired.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def read_token(self) -> int:
+        """Take a token to pass to set for a value about to be loaded.
+
+        Returns:
+            The current invalidation generation.
+        """
+        return self._generation
+
+    def set(self, key: K, value: V, token: int | None = None) -> None:
+        """Store a value, evicting the oldest entry if the cache is full.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to cache.
+            token: Token taken with read_token before the value was loaded.
+                If the key has been invalidated since, the value is dropped.
+        """
+        if token is not None and (
+            token < self._forgotten_generation
+            or self._invalidated_at.get(key, 0) > token
+        ):
+            return
+        # Re-insert so the key moves to the end of the eviction order
+        _ = self._entries.pop(key, None)
+        self._entries[key] = (monotonic() + self.ttl, value)
+        if len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, key: K) -> None:
+        """Drop a cached value, if present.
+
+        Values loaded under a token taken before this call are no longer
+        accepted by set for this key.
+
+        Args:
+            key: The key to drop.
+        """
+        _ = self._entries.pop(key, None)
+        self._generation += 1
+        # Re-insert so the key moves to the end of the forgetting order
+        _ = self._invalidated_at.pop(key, None)
+        self._invalidated_at[key] = self._generation
+        if len(self._invalidated_at) > self.maxsize:
+            oldest = next(iter(self._invalidated_at))
+            self._forgotten_generation = self._invalidated_at.pop(oldest)
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._entries)
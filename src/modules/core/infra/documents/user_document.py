@@ -1,6 +1,7 @@
 """User Document model using Beanie ODM."""
 
 from beanie import Document
+from pymongo import IndexModel
 
 
 class UserDocument(Document):
@@ -9,3 +10,9 @@ class UserDocument(Document):
     name: str
     age: int
     email: str
+
+    class Settings:
+        """Collection settings, applied by init_beanie on startup."""
+
+        # Lookups by ID use the implicit _id index; email must be unique
+        indexes = [IndexModel("email", unique=True)]
@@ -4,21 +4,63 @@ This module serves as the composition root for the application, demonstrating
 the creation and usage of User entities with domain-specific functionality.
 """
 
-from beanie import init_beanie  # pyright: ignore[reportUnknownVariableType]
+import asyncio
+from typing import TYPE_CHECKING, Any
+
 from litestar import Litestar, Router
-from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo.asynchronous.database import AsyncDatabase
 
+from src.container import container
 from src.modules.account.controllers.account_controllers import UserController
+from src.modules.core.domain.event_dispatcher import AsyncQueueEventDispatcher
 from src.modules.core.infra.documents.user_document import UserDocument
 from src.settings import CONFIG
 
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+
+# One client per process, opened by the first startup and closed on shutdown.
+# Repeated startups reuse it instead of opening another connection pool. It
+# is not created at import time, since Mongo clients must not cross a fork.
+_client: "AsyncIOMotorClient[dict[str, Any]] | None" = None
+_client_lock = asyncio.Lock()
+
 
 async def on_startup() -> None:
     """Initialize database connections and document models on application startup."""
-    client = AsyncIOMotorClient(CONFIG.MONGO_URI)  # pyright: ignore[reportUnknownVariableType]
-    database = client[CONFIG.MONGO_DATABASE]  # pyright: ignore[reportUnknownVariableType]
-    await init_beanie(database=database, document_models=[UserDocument])  # pyright: ignore[reportArgumentType]
+    # Imported here so that importing the app, e.g. in tests, does not load
+    # the Motor driver until a database is actually needed
+    from beanie import init_beanie  # pyright: ignore[reportUnknownVariableType]
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    global _client
+    async with _client_lock:
+        if _client is not None:
+            return
+        client = AsyncIOMotorClient(CONFIG.MONGO_URI)  # pyright: ignore[reportUnknownVariableType]
+        database = client[CONFIG.MONGO_DATABASE]  # pyright: ignore[reportUnknownVariableType]
+        await init_beanie(database=database, document_models=[UserDocument])  # pyright: ignore[reportArgumentType]
+        _client = client
+
+
+async def on_shutdown() -> None:
+    """Close the database client, if one was opened."""
+    global _client
+    async with _client_lock:
+        if _client is None:
+            return
+        _client.close()
+        _client = None
+
+
+async def start_event_dispatcher() -> None:
+    """Start delivering domain events in the background."""
+    container[AsyncQueueEventDispatcher].start()
+
+
+async def stop_event_dispatcher() -> None:
+    """Deliver pending domain events and stop the background worker."""
+    await container[AsyncQueueEventDispatcher].stop()
 
 
 def create_app() -> Litestar:
@@ -28,5 +70,9 @@ def create_app() -> Litestar:
         Litestar: The configured Litestar application instance.
     """
     router = Router(path="/api", route_handlers=[UserController])
-    app = Litestar(route_handlers=[router], on_startup=[on_startup])
+    app = Litestar(
+        route_handlers=[router],
+        on_startup=[on_startup, start_event_dispatcher],
+        on_shutdown=[stop_event_dispatcher, on_shutdown],
+    )
     return app